@@ -6,7 +6,7 @@ import os
 from typing import Optional, Dict, Any
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.pool import StaticPool
 
@@ -66,7 +66,10 @@ def get_engine() -> Engine:
         options = config.get('OPTIONS', {})
         
         if 'sqlite' in engine_type:
-            database_url = f"sqlite:///{config.get('NAME', 'db.sqlite3')}"
+            name = config.get('NAME', 'db.sqlite3')
+            database_url = f"sqlite:///{name}"
+            # StaticPool keeps a single connection, so a ':memory:' database
+            # is shared by every session instead of one per connection
             connect_args = {"check_same_thread": False}
             connect_args.update(options.get('connect_args', {}))
             
@@ -76,6 +79,13 @@ def get_engine() -> Engine:
                 poolclass=StaticPool,
                 **options.get('engine_options', {})
             )
+            
+            pragmas = dict(options.get('PRAGMAS', {}))
+            if str(name) == ':memory:':
+                # In-memory databases have no journal file to switch to WAL
+                pragmas.pop('journal_mode', None)
+            if pragmas:
+                _set_sqlite_pragmas(_engine, pragmas)
         elif 'postgresql' in engine_type or 'postgres' in engine_type:
             user = config.get('USER', '')
             password = config.get('PASSWORD', '')
@@ -110,6 +120,25 @@ def get_engine() -> Engine:
     return _engine
 
 
+def _set_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]):
+    """
+    Run ``PRAGMA name=value`` for each entry on every new SQLite connection.
+    
+    Args:
+        engine: The SQLite engine
+        pragmas: Pragma names mapped to their values, e.g.
+            ``{'journal_mode': 'WAL', 'synchronous': 'NORMAL'}``
+    """
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
 def get_session_factory() -> sessionmaker:
     """
     Get or create the session factory.
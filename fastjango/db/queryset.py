@@ -4,7 +4,7 @@ QuerySet for FastJango ORM - Django-like query operations.
 
 from typing import Any, List, Optional, Union, Dict, Tuple, Callable
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_, or_, not_, func, desc, asc
+from sqlalchemy import select, insert, inspect, update, delete, and_, or_, not_, func, desc, asc
 from sqlalchemy.sql import Select, Update, Delete
 
 from .connection import get_session
@@ -321,6 +321,15 @@ class QuerySet:
         """
         Create multiple objects efficiently.
         
+        Rows are inserted with a Core ``INSERT`` executed once per batch
+        (``executemany``), bypassing the per-object ORM flush, and all
+        batches are committed together. Unlike Django on backends with
+        ``RETURNING``, primary keys are not set on these instances.
+        
+        Objects with a related object assigned (``Product(category=c)``) are
+        added through the ORM instead, in the same transaction, so their
+        foreign keys are resolved; those do get their primary keys.
+        
         Args:
             objects: List of model instances
             batch_size: Number of objects to create per batch
@@ -328,15 +337,38 @@ class QuerySet:
         Returns:
             List of created objects
         """
-        created_objects = []
-        
-        for i in range(0, len(objects), batch_size):
-            batch = objects[i:i + batch_size]
-            self.session.add_all(batch)
+        table = self.model.__table__
+        
+        # executemany needs the same keys in every row, so group rows by the
+        # columns they set; explicit values, None included, are kept and
+        # unset columns are left to their defaults
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        related = []
+        for obj in objects:
+            state = inspect(obj)
+            values = state.dict
+            if any(values.get(rel.key) is not None for rel in state.mapper.relationships):
+                related.append(obj)
+                continue
+            row = {}
+            for attr in state.mapper.column_attrs:
+                if attr.key in values:
+                    row[attr.columns[0].key] = values[attr.key]
+            groups.setdefault(tuple(row), []).append(row)
+        
+        statement = insert(table)
+        try:
+            for rows in groups.values():
+                for i in range(0, len(rows), batch_size):
+                    self.session.execute(statement, rows[i:i + batch_size])
+            if related:
+                self.session.add_all(related)
             self.session.commit()
-            created_objects.extend(batch)
+        except Exception:
+            self.session.rollback()
+            raise
         
-        return created_objects
+        return list(objects)
     
     def update(self, **kwargs) -> int:
         """
@@ -190,7 +190,7 @@ def generate_unique_filename(original_name: str) -> str:
     # Generate hash from original name and timestamp
     timestamp = str(datetime.now().timestamp())
     hash_input = f"{original_name}{timestamp}".encode()
-    hash_value = hashlib.md5(hash_input).hexdigest()[:8]
+    hash_value = hashlib.blake2b(hash_input, digest_size=4).hexdigest()
     
     # Get file extension
     name_parts = original_name.rsplit('.', 1)
@@ -5,7 +5,8 @@ This module provides CORS middleware for FastJango, similar to Django's
 CORS middleware but adapted for FastAPI.
 """
 
-from typing import List, Optional, Union, Dict, Any
+import re
+from typing import List, Optional, Union, Dict, Any, Pattern
 from urllib.parse import urlparse
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -16,6 +17,31 @@ from fastjango.core.exceptions import FastJangoError
 from fastjango.core.settings import get_settings_instance, get_cors_settings
 
 
+def _combine_origin_regexes(patterns: List[Union[str, Pattern]]) -> Optional[Pattern]:
+    """
+    Fold origin regexes into a single alternation matched in one pass.
+    
+    Returns None when there is nothing to combine or the patterns cannot be
+    merged safely (compiled with flags, or containing groups, whose numbers
+    and backreferences would shift in the alternation); callers then match
+    the patterns one by one.
+    """
+    parts = []
+    for pattern in patterns:
+        compiled = re.compile(pattern)
+        if compiled.flags != re.UNICODE or compiled.groups:
+            return None
+        parts.append(f"(?:{compiled.pattern})")
+    
+    if not parts:
+        return None
+    
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
 class CORSMiddleware(BaseHTTPMiddleware):
     """
     Django-like CORS middleware for FastJango.
@@ -26,7 +52,7 @@ class CORSMiddleware(BaseHTTPMiddleware):
     
     def __init__(self, app,
                  allowed_origins: Optional[List[str]] = None,
-                 allowed_origin_regexes: Optional[List[str]] = None,
+                 allowed_origin_regexes: Optional[List[Union[str, Pattern]]] = None,
                  allowed_methods: Optional[List[str]] = None,
                  allowed_headers: Optional[List[str]] = None,
                  exposed_headers: Optional[List[str]] = None,
@@ -41,7 +67,8 @@ class CORSMiddleware(BaseHTTPMiddleware):
         Args:
             app: The FastAPI application
             allowed_origins: List of allowed origins
-            allowed_origin_regexes: List of allowed origin regexes
+            allowed_origin_regexes: List of allowed origin regexes (strings or
+                precompiled patterns)
             allowed_methods: List of allowed HTTP methods
             allowed_headers: List of allowed headers
             exposed_headers: List of exposed headers
@@ -67,6 +94,11 @@ class CORSMiddleware(BaseHTTPMiddleware):
         self.allow_all_origins = allow_all_origins or cors_settings['allow_all_origins']
         self.allow_all_methods = allow_all_methods or cors_settings['allow_all_methods']
         self.allow_all_headers = allow_all_headers or cors_settings['allow_all_headers']
+        
+        # Hash lookup for exact origins; re.compile returns compiled patterns as-is
+        self._allowed_origins_set = frozenset(self.allowed_origins)
+        self._origin_patterns = tuple(re.compile(p) for p in self.allowed_origin_regexes)
+        self._origin_regex = _combine_origin_regexes(self.allowed_origin_regexes)
     
     def _is_origin_allowed(self, origin: str) -> bool:
         """Check if origin is allowed."""
@@ -74,13 +106,15 @@ class CORSMiddleware(BaseHTTPMiddleware):
             return True
         
         # Check exact matches
-        if origin in self.allowed_origins:
+        if origin in self._allowed_origins_set:
             return True
         
         # Check regex matches
-        import re
-        for pattern in self.allowed_origin_regexes:
-            if re.match(pattern, origin):
+        if self._origin_regex is not None:
+            return self._origin_regex.match(origin) is not None
+        
+        for pattern in self._origin_patterns:
+            if pattern.match(origin):
                 return True
         
         return False
@@ -5,7 +5,9 @@ This module provides security middleware for FastJango, similar to Django's
 security middleware but adapted for FastAPI.
 """
 
+import re
 import time
+from fnmatch import translate
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 
@@ -72,13 +74,26 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         self.secure_cross_origin_opener_policy = secure_cross_origin_opener_policy
         self.secure_cross_origin_embedder_policy = secure_cross_origin_embedder_policy
         self.secure_cross_origin_resource_policy = secure_cross_origin_resource_policy
+        
+        # Exact hosts go in a set; "*.example.com" style entries share one regex
+        self._allow_all_hosts = "*" in self.allowed_hosts
+        self._allowed_hosts_set = frozenset(
+            h.lower() for h in self.allowed_hosts if not h.startswith("*")
+        )
+        wildcards = [translate(h.lower()) for h in self.allowed_hosts if h.startswith("*.")]
+        self._allowed_hosts_wildcard_re = re.compile("|".join(wildcards)) if wildcards else None
     
     def _is_allowed_host(self, host: str) -> bool:
         """Check if host is allowed."""
-        if "*" in self.allowed_hosts:
+        if self._allow_all_hosts:
+            return True
+        
+        host = host.lower()
+        if host in self._allowed_hosts_set:
             return True
         
-        return host in self.allowed_hosts
+        wildcard_re = self._allowed_hosts_wildcard_re
+        return wildcard_re is not None and wildcard_re.match(host) is not None
     
     def _get_security_headers(self) -> Dict[str, str]:
         """Get security headers to add."""
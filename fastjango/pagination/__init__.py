@@ -13,6 +13,7 @@ from .fastapi_pagination import (
     FastAPIPagination, FastAPIPageNumberPagination,
     FastAPILimitOffsetPagination, FastAPICursorPagination
 )
+from .response import PaginatedORJSONResponse
 from .django_like import (
     DjangoLikePagination, DjangoLikePageNumberPagination,
     DjangoLikeLimitOffsetPagination, DjangoLikeCursorPagination
@@ -38,4 +39,7 @@ __all__ = [
     'DjangoLikePageNumberPagination',
     'DjangoLikeLimitOffsetPagination',
     'DjangoLikeCursorPagination',
+    
+    # Responses
+    'PaginatedORJSONResponse',
 ]
@@ -0,0 +1,45 @@
+"""
+Optional Numba kernels for cursor pagination.
+
+When Numba is installed, ``cursor_slice_idx`` is compiled on first use (and
+cached on disk, so later processes skip the compile). The first call pays a
+one-time JIT cost; without Numba it is ``None`` and callers fall back to
+NumPy or pure Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _cursor_slice_idx(keys, cursor, page_size, reverse):
+    """
+    Return ``(start, end)`` bounds of the page after ``cursor``.
+
+    ``keys`` is a 1-D numeric array sorted by the pagination ordering,
+    descending when ``reverse`` is true.
+    """
+    n = keys.shape[0]
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if reverse:
+            after = keys[mid] < cursor
+        else:
+            after = keys[mid] > cursor
+        if after:
+            hi = mid
+        else:
+            lo = mid + 1
+    end = lo + page_size
+    if end > n:
+        end = n
+    return lo, end
+
+
+if njit is not None:
+    cursor_slice_idx = njit(cache=True)(_cursor_slice_idx)
+else:
+    cursor_slice_idx = None
@@ -0,0 +1,22 @@
+"""
+Production overrides for the FastJango example settings.
+
+Imported by ``example_settings`` only when ``DEBUG`` is off.
+"""
+
+SECURE_SSL_REDIRECT = True
+SECURE_HSTS_SECONDS = 31536000  # 1 year
+SECURE_HSTS_INCLUDE_SUBDOMAINS = True
+SECURE_HSTS_PRELOAD = True
+SECURE_CONTENT_SECURITY_POLICY = "default-src 'self'"
+SECURE_REFERRER_POLICY = 'strict-origin-when-cross-origin'
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
+
+# Production CORS settings
+CORS_ALLOWED_ORIGINS = [
+    "https://your-production-domain.com",
+    "https://www.your-production-domain.com",
+]
+CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_ALL_ORIGINS = False
@@ -5,21 +5,47 @@ This module provides Django-like pagination for FastJango, mimicking
 Django DRF pagination behavior and API structure.
 """
 
-from typing import List, Dict, Any, Optional, Generic, TypeVar, Union
+from typing import List, Dict, Any, Optional, Generic, TypeVar, Union, Callable, Tuple, FrozenSet
 from fastapi import Request, Query, Depends
 from pydantic import BaseModel, Field
-from math import ceil
-from urllib.parse import urlencode, parse_qs, urlparse, urlunparse
+from functools import lru_cache
+from operator import itemgetter
 
-from .pagination import BasePagination, PaginationResponse, PaginationParams
+from .pagination import BasePagination, PaginationResponse, PaginationParams, _attr_key, _build_url, _sort_by_key
 
 
 T = TypeVar('T')
 
 
+@lru_cache(maxsize=256)
+def _parse_ordering(ordering: str) -> Tuple[Tuple[str, bool, Callable[[Any], Any]], ...]:
+    """
+    Parse an ordering string such as ``"name,-id"``.
+    
+    Returns a tuple of ``(field, reverse, getter)`` entries. Results are
+    cached, so repeated orderings reuse the same key functions; items
+    without a field sort as 0.
+    """
+    order_fields = []
+    
+    for field in ordering.split(','):
+        field = field.strip()
+        if not field:
+            continue
+        
+        reverse = field.startswith('-')
+        sort_key = field[1:] if reverse else field
+        order_fields.append((sort_key, reverse, _attr_key(sort_key)))
+    
+    return tuple(order_fields)
+
+
 class DjangoLikePagination(BasePagination):
     """Django-like pagination with DRF-style behavior."""
     
+    # Fields clients may order by; None allows any attribute
+    orderable_fields: Optional[FrozenSet[str]] = None
+    
     def __init__(self, 
                  page_size: int = 20,
                  max_page_size: int = 100,
@@ -60,16 +86,16 @@ class DjangoLikePagination(BasePagination):
         if not ordering:
             return queryset
         
-        # Parse ordering fields
-        order_fields = [field.strip() for field in ordering.split(',')]
+        orderable_fields = self.orderable_fields
         
         # Sort queryset by multiple fields
-        for field in reversed(order_fields):
-            reverse = field.startswith('-')
-            sort_key = field[1:] if reverse else field
+        for sort_key, reverse, getter in reversed(_parse_ordering(ordering)):
+            if orderable_fields is not None and sort_key not in orderable_fields:
+                # Ignore fields that are not whitelisted
+                continue
             
             try:
-                queryset = sorted(queryset, key=lambda x: getattr(x, sort_key, 0), reverse=reverse)
+                queryset = _sort_by_key(queryset, getter, reverse=reverse)
             except (AttributeError, TypeError):
                 # Fallback to default sorting
                 pass
@@ -80,7 +106,7 @@ class DjangoLikePagination(BasePagination):
         """Get paginated response in Django DRF style."""
         params = self.get_pagination_params(request)
         
-        total_pages = ceil(count / params.page_size) if count > 0 else 0
+        total_pages = -(-count // params.page_size) if count > 0 else 0
         has_next = params.page < total_pages
         has_previous = params.page > 1
         
@@ -88,15 +114,15 @@ class DjangoLikePagination(BasePagination):
         next_url = None
         previous_url = None
         
-        base_url = str(request.url)
+        base_url = request.url
         
         if has_next:
-            next_url = self._build_url(base_url, {self.page_query_param: params.page + 1})
+            next_url = _build_url(base_url, {self.page_query_param: params.page + 1})
         
         if has_previous:
-            previous_url = self._build_url(base_url, {self.page_query_param: params.page - 1})
+            previous_url = _build_url(base_url, {self.page_query_param: params.page - 1})
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -122,19 +148,11 @@ class DjangoLikePageNumberPagination(DjangoLikePagination):
     
     def get_page_number(self, request: Request) -> int:
         """Get page number in Django style."""
-        try:
-            page = int(request.query_params.get(self.page_query_param, 1))
-            return max(1, page)
-        except (ValueError, TypeError):
-            return 1
+        return self._parse_int(request, self.page_query_param, 1, low=1)
     
     def get_page_size(self, request: Request) -> int:
         """Get page size in Django style."""
-        try:
-            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
-            return min(page_size, self.max_page_size)
-        except (ValueError, TypeError):
-            return self.page_size
+        return self._parse_int(request, self.page_size_query_param, self.page_size, high=self.max_page_size)
 
 
 class DjangoLikeLimitOffsetPagination(DjangoLikePagination):
@@ -162,19 +180,11 @@ class DjangoLikeLimitOffsetPagination(DjangoLikePagination):
     
     def get_limit(self, request: Request) -> int:
         """Get limit in Django style."""
-        try:
-            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
-            return min(limit, self.max_limit)
-        except (ValueError, TypeError):
-            return self.default_limit
+        return self._parse_int(request, self.limit_query_param, self.default_limit, high=self.max_limit)
     
     def get_offset(self, request: Request) -> int:
         """Get offset in Django style."""
-        try:
-            offset = int(request.query_params.get(self.offset_query_param, 0))
-            return max(0, offset)
-        except (ValueError, TypeError):
-            return 0
+        return self._parse_int(request, self.offset_query_param, 0, low=0)
     
     def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
         """Paginate queryset using limit/offset."""
@@ -190,34 +200,37 @@ class DjangoLikeLimitOffsetPagination(DjangoLikePagination):
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response for limit/offset."""
         params = self.get_pagination_params(request)
+        limit = params.limit
+        offset = params.offset
+        next_offset = offset + limit
         
-        has_next = params.offset + params.limit < count
-        has_previous = params.offset > 0
+        has_next = next_offset < count
+        has_previous = offset > 0
         
         # Build pagination links
         next_url = None
         previous_url = None
         
-        base_url = str(request.url)
+        base_url = request.url
         
         if has_next:
-            next_url = self._build_url(base_url, {
-                self.limit_query_param: params.limit,
-                self.offset_query_param: params.offset + params.limit
+            next_url = _build_url(base_url, {
+                self.limit_query_param: limit,
+                self.offset_query_param: next_offset
             })
         
         if has_previous:
-            previous_url = self._build_url(base_url, {
-                self.limit_query_param: params.limit,
-                self.offset_query_param: max(0, params.offset - params.limit)
+            previous_url = _build_url(base_url, {
+                self.limit_query_param: limit,
+                self.offset_query_param: offset - limit if offset > limit else 0
             })
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
             results=data,
-            page_size=params.limit,
+            page_size=limit,
             has_next=has_next,
             has_previous=has_previous
         )
@@ -252,33 +265,30 @@ class DjangoLikeCursorPagination(DjangoLikePagination):
         cursor = self.get_cursor(request)
         page_size = self.get_page_size(request)
         
-        # Sort queryset by ordering
-        reverse = self.ordering.startswith('-')
-        sort_key = self.ordering[1:] if reverse else self.ordering
+        # Sort queryset by ordering; without one every item sorts as 0
+        order_fields = _parse_ordering(self.ordering)
+        _, reverse, getter = order_fields[0] if order_fields else ('', False, _attr_key(''))
         
-        # Sort the queryset
-        sorted_queryset = sorted(queryset, key=lambda x: getattr(x, sort_key, 0), reverse=reverse)
+        # Decorate each item with its key once, sort on the key, then undecorate
+        decorated = sorted(((getter(item), item) for item in queryset), key=itemgetter(0), reverse=reverse)
+        sorted_keys = [key for key, _ in decorated]
+        sorted_queryset = [item for _, item in decorated]
         
-        if cursor:
-            # Find position after cursor
-            try:
-                cursor_value = int(cursor)
-                # Find items after cursor
-                filtered_queryset = []
-                found_cursor = False
-                
-                for item in sorted_queryset:
-                    item_value = getattr(item, sort_key, 0)
-                    if found_cursor:
-                        filtered_queryset.append(item)
-                    elif item_value == cursor_value:
-                        found_cursor = True
-                
-                return filtered_queryset[:page_size]
-            except (ValueError, TypeError):
-                return sorted_queryset[:page_size]
-        else:
+        if not cursor:
             return sorted_queryset[:page_size]
+        
+        try:
+            cursor_value = int(cursor)
+        except (ValueError, TypeError):
+            return sorted_queryset[:page_size]
+        
+        # Find position after cursor
+        try:
+            start = sorted_keys.index(cursor_value) + 1
+        except ValueError:
+            return []
+        
+        return sorted_queryset[start:start + page_size]
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response for cursor pagination."""
@@ -292,15 +302,15 @@ class DjangoLikeCursorPagination(DjangoLikePagination):
         next_url = None
         previous_url = None
         
-        base_url = str(request.url)
+        base_url = request.url
         
         if has_next and data:
             last_item = data[-1]
             sort_key = self.ordering[1:] if self.ordering.startswith('-') else self.ordering
             next_cursor = getattr(last_item, sort_key, last_item.id)
-            next_url = self._build_url(base_url, {self.cursor_query_param: str(next_cursor)})
+            next_url = _build_url(base_url, {self.cursor_query_param: str(next_cursor)})
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -345,7 +355,7 @@ class DjangoDRFPageNumberPagination(DjangoLikePageNumberPagination):
         """Get paginated response in Django DRF style."""
         params = self.get_pagination_params(request)
         
-        total_pages = ceil(count / params.page_size) if count > 0 else 0
+        total_pages = -(-count // params.page_size) if count > 0 else 0
         has_next = params.page < total_pages
         has_previous = params.page > 1
         
@@ -353,15 +363,15 @@ class DjangoDRFPageNumberPagination(DjangoLikePageNumberPagination):
         next_url = None
         previous_url = None
         
-        base_url = str(request.url)
+        base_url = request.url
         
         if has_next:
-            next_url = self._build_url(base_url, {self.page_query_param: params.page + 1})
+            next_url = _build_url(base_url, {self.page_query_param: params.page + 1})
         
         if has_previous:
-            previous_url = self._build_url(base_url, {self.page_query_param: params.page - 1})
+            previous_url = _build_url(base_url, {self.page_query_param: params.page - 1})
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -380,34 +390,37 @@ class DjangoDRFLimitOffsetPagination(DjangoLikeLimitOffsetPagination):
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response in Django DRF style."""
         params = self.get_pagination_params(request)
+        limit = params.limit
+        offset = params.offset
+        next_offset = offset + limit
         
-        has_next = params.offset + params.limit < count
-        has_previous = params.offset > 0
+        has_next = next_offset < count
+        has_previous = offset > 0
         
         # Build pagination links
         next_url = None
         previous_url = None
         
-        base_url = str(request.url)
+        base_url = request.url
         
         if has_next:
-            next_url = self._build_url(base_url, {
-                self.limit_query_param: params.limit,
-                self.offset_query_param: params.offset + params.limit
+            next_url = _build_url(base_url, {
+                self.limit_query_param: limit,
+                self.offset_query_param: next_offset
             })
         
         if has_previous:
-            previous_url = self._build_url(base_url, {
-                self.limit_query_param: params.limit,
-                self.offset_query_param: max(0, params.offset - params.limit)
+            previous_url = _build_url(base_url, {
+                self.limit_query_param: limit,
+                self.offset_query_param: offset - limit if offset > limit else 0
             })
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
             results=data,
-            page_size=params.limit,
+            page_size=limit,
             has_next=has_next,
             has_previous=has_previous
         )
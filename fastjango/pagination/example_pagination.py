@@ -3,19 +3,22 @@ FastJango Pagination Example - Demonstrating pagination features.
 
 This example shows how to use FastJango pagination with FastAPI,
 including different pagination types and Django-like settings.
+
+Responses are serialized with ORJSONResponse, which requires ``orjson``.
 """
 
 import os
 import sys
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache
 
 # Add the parent directory to the path to import fastjango
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from fastapi import FastAPI, Request, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from fastjango.core.settings import FastJangoSettings, configure_settings
 from fastjango.pagination import (
@@ -58,6 +61,80 @@ def generate_sample_users(count: int = 100) -> List[User]:
 SAMPLE_USERS = generate_sample_users(100)
 
 
+@dataclass(frozen=True)
+class UserTable:
+    """Column-oriented copy of the sample users for filtering and sorting."""
+    id: Tuple[int, ...]
+    name: Tuple[str, ...]
+    email: Tuple[str, ...]
+    created_at: Tuple[datetime, ...]
+    is_active: Tuple[bool, ...]
+    name_lower: Tuple[str, ...] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Lowercased names for case-insensitive search
+        object.__setattr__(self, 'name_lower', tuple(name.lower() for name in self.name))
+    
+    @classmethod
+    def from_users(cls, users: List[User]) -> "UserTable":
+        """Build the table from a list of users."""
+        return cls(*(
+            tuple(getattr(user, f.name) for user in users) for f in fields(User)
+        ))
+    
+    def __len__(self) -> int:
+        return len(self.id)
+    
+    def row(self, index: int) -> User:
+        """Reconstruct the user stored at index."""
+        return User(
+            id=self.id[index],
+            name=self.name[index],
+            email=self.email[index],
+            created_at=self.created_at[index],
+            is_active=self.is_active[index]
+        )
+
+
+# Rebuild USER_TABLE and bump SAMPLE_USERS_VERSION whenever SAMPLE_USERS
+# changes so memoized orderings are discarded
+USER_TABLE = UserTable.from_users(SAMPLE_USERS)
+SAMPLE_USERS_VERSION = 0
+
+# Fields users may be ordered by
+USER_FIELDS = frozenset(f.name for f in fields(User))
+
+
+@lru_cache(maxsize=32)
+def _user_order(ordering: str, version: int) -> Tuple[int, ...]:
+    """Get the row indices of USER_TABLE sorted by ordering."""
+    reverse = ordering.startswith('-')
+    sort_key = ordering[1:] if reverse else ordering
+    
+    if sort_key not in USER_FIELDS:
+        # Fallback to name sorting
+        sort_key = 'name'
+    
+    column = getattr(USER_TABLE, sort_key)
+    return tuple(sorted(range(len(column)), key=column.__getitem__, reverse=reverse))
+
+
+@lru_cache(maxsize=32)
+def _sorted_users(ordering: str, version: int) -> Tuple[User, ...]:
+    """Sort the sample users by ordering, memoized per data version."""
+    return tuple(SAMPLE_USERS[i] for i in _user_order(ordering, version))
+
+
+def get_user_order(ordering: str) -> Tuple[int, ...]:
+    """Get the sample user row indices sorted by ordering."""
+    return _user_order(ordering, SAMPLE_USERS_VERSION)
+
+
+def get_sorted_users(ordering: str) -> Tuple[User, ...]:
+    """Get the sample users sorted by ordering, reusing earlier sorts."""
+    return _sorted_users(ordering, SAMPLE_USERS_VERSION)
+
+
 # Configure settings
 settings_dict = {
     'DEBUG': True,
@@ -77,7 +154,8 @@ configure_settings(settings_dict)
 app = FastAPI(
     title="FastJango Pagination Example",
     description="Demonstrating pagination features with FastAPI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -96,7 +174,7 @@ async def get_users_page(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/limit-offset")
@@ -113,7 +191,7 @@ async def get_users_limit_offset(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/cursor")
@@ -124,13 +202,13 @@ async def get_users_cursor(
     """Get users with cursor pagination."""
     paginator = CursorPagination(page_size=10, ordering="-id")
     
-    # Get paginated data
-    paginated_users = paginator.paginate_queryset(SAMPLE_USERS, request)
+    # Get paginated data; pre-sorted input makes the paginator's sort linear
+    paginated_users = paginator.paginate_queryset(get_sorted_users("-id"), request)
     
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 # FastAPI pagination endpoints
@@ -148,7 +226,7 @@ async def get_users_fastapi_page(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/fastapi-limit-offset")
@@ -165,7 +243,7 @@ async def get_users_fastapi_limit_offset(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/fastapi-cursor")
@@ -176,13 +254,13 @@ async def get_users_fastapi_cursor(
     """Get users with FastAPI cursor pagination."""
     paginator = FastAPICursorPagination(page_size=10, ordering="-id")
     
-    # Get paginated data
-    paginated_users = paginator.paginate_queryset(SAMPLE_USERS, request)
+    # Get paginated data; pre-sorted input makes the paginator's sort linear
+    paginated_users = paginator.paginate_queryset(get_sorted_users("-id"), request)
     
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 # Django-like pagination endpoints
@@ -193,6 +271,7 @@ async def get_users_django_page(
 ):
     """Get users with Django-like page number pagination."""
     paginator = DjangoLikePageNumberPagination(page_size=10)
+    paginator.orderable_fields = USER_FIELDS
     
     # Get paginated data
     paginated_users = paginator.paginate_queryset(SAMPLE_USERS, request)
@@ -200,7 +279,7 @@ async def get_users_django_page(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/django-limit-offset")
@@ -210,6 +289,7 @@ async def get_users_django_limit_offset(
 ):
     """Get users with Django-like limit/offset pagination."""
     paginator = DjangoLikeLimitOffsetPagination(default_limit=10, max_limit=50)
+    paginator.orderable_fields = USER_FIELDS
     
     # Get paginated data
     paginated_users = paginator.paginate_queryset(SAMPLE_USERS, request)
@@ -217,7 +297,7 @@ async def get_users_django_limit_offset(
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/users/django-cursor")
@@ -228,13 +308,13 @@ async def get_users_django_cursor(
     """Get users with Django-like cursor pagination."""
     paginator = DjangoLikeCursorPagination(page_size=10, ordering="-id")
     
-    # Get paginated data
-    paginated_users = paginator.paginate_queryset(SAMPLE_USERS, request)
+    # Get paginated data; pre-sorted input makes the paginator's sort linear
+    paginated_users = paginator.paginate_queryset(get_sorted_users("-id"), request)
     
     # Get paginated response
     response = paginator.get_paginated_response(paginated_users, len(SAMPLE_USERS), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 # Advanced pagination with filtering and ordering
@@ -248,35 +328,31 @@ async def get_users_advanced(
     is_active: bool = Query(None, description="Filter by active status")
 ):
     """Get users with advanced pagination, filtering, and ordering."""
-    # Filter users
-    filtered_users = SAMPLE_USERS.copy()
-    
-    if search:
-        filtered_users = [u for u in filtered_users if search.lower() in u.name.lower()]
-    
-    if is_active is not None:
-        filtered_users = [u for u in filtered_users if u.is_active == is_active]
-    
-    # Apply ordering
-    reverse = ordering.startswith('-')
-    sort_key = ordering[1:] if reverse else ordering
-    
-    try:
-        filtered_users.sort(key=lambda x: getattr(x, sort_key, x.name), reverse=reverse)
-    except (AttributeError, TypeError):
-        # Fallback to name sorting
-        filtered_users.sort(key=lambda x: x.name)
+    filtered_rows = get_user_order(ordering)
+    
+    # Filter row indices in a single pass over the memoized ordering; with
+    # no filters the cached ordering is paginated directly without a copy
+    if search or is_active is not None:
+        search_lower = search.lower() if search else None
+        names_lower = USER_TABLE.name_lower
+        active = USER_TABLE.is_active
+        
+        filtered_rows = [
+            i for i in filtered_rows
+            if (search_lower is None or search_lower in names_lower[i])
+            and (is_active is None or active[i] == is_active)
+        ]
     
     # Apply pagination
     paginator = PageNumberPagination(page_size=page_size)
     
-    # Get paginated data
-    paginated_users = paginator.paginate_queryset(filtered_users, request)
+    # Get paginated data, building users only for the rows on this page
+    paginated_users = [USER_TABLE.row(i) for i in paginator.paginate_queryset(filtered_rows, request)]
     
     # Get paginated response
-    response = paginator.get_paginated_response(paginated_users, len(filtered_users), request)
+    response = paginator.get_paginated_response(paginated_users, len(filtered_rows), request)
     
-    return JSONResponse(content=response.dict())
+    return ORJSONResponse(response.model_dump())
 
 
 # Settings endpoint
@@ -286,7 +362,7 @@ async def get_settings():
     from fastjango.core.settings import get_settings_instance
     settings = get_settings_instance()
     
-    return JSONResponse(content={
+    return ORJSONResponse({
         'DEBUG': settings.DEBUG,
         'ALLOWED_HOSTS': settings.ALLOWED_HOSTS,
         'CORS_ALLOWED_ORIGINS': settings.CORS_ALLOWED_ORIGINS,
@@ -299,7 +375,7 @@ async def get_settings():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return JSONResponse(content={"status": "healthy", "timestamp": datetime.now().isoformat()})
+    return ORJSONResponse({"status": "healthy", "timestamp": datetime.now().isoformat()})
 
 
 if __name__ == "__main__":
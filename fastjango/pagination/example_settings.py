@@ -5,11 +5,25 @@ This example demonstrates how to configure FastJango settings similar to Django,
 including ALLOWED_HOSTS validation and comprehensive CORS configuration.
 """
 
+import functools
 import os
+import re
+from fnmatch import translate
 from pathlib import Path
 
+_THIS = Path(__file__)
+
+
+@functools.lru_cache(maxsize=None)
+def _base_dir():
+    """Return BASE_DIR with symlinks resolved (costs a realpath() on first call)."""
+    return _THIS.resolve().parent.parent
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+# Not resolved, to skip the stat calls at import; use _base_dir() if the
+# project is reached through a symlink.
+BASE_DIR = _THIS.parent.parent
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'django-insecure-your-secret-key-here'
@@ -41,6 +55,14 @@ CORS_ALLOWED_ORIGIN_REGEXES = [
     r"^https://\w+\.your-subdomain\.com$",
 ]
 
+
+def _compile_cors_regexes(patterns):
+    """Compile origin regexes once at import instead of on every request."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+CORS_ALLOWED_ORIGIN_REGEXES_COMPILED = _compile_cors_regexes(CORS_ALLOWED_ORIGIN_REGEXES)
+
 CORS_ALLOWED_METHODS = [
     'GET',
     'POST',
@@ -153,19 +175,20 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # Templates Configuration (Django-like)
-TEMPLATES = [
-    {
-        'BACKEND': 'fastjango.templates.backends.jinja2.Jinja2Templates',
-        'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
-        'OPTIONS': {
-            'context_processors': [
-                'fastjango.templates.context_processors.debug',
-                'fastjango.templates.context_processors.request',
-            ],
+def _build_templates():
+    return [
+        {
+            'BACKEND': 'fastjango.templates.backends.jinja2.Jinja2Templates',
+            'DIRS': [BASE_DIR / 'templates'],
+            'APP_DIRS': True,
+            'OPTIONS': {
+                'context_processors': [
+                    'fastjango.templates.context_processors.debug',
+                    'fastjango.templates.context_processors.request',
+                ],
+            },
         },
-    },
-]
+    ]
 
 # Session Configuration (Django-like)
 SESSION_COOKIE_NAME = 'sessionid'
@@ -194,61 +217,64 @@ API_DEFAULT_PARSER_CLASSES = [
 ]
 
 # Logging Configuration (Django-like)
-LOGGING = {
-    'version': 1,
-    'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
+def _build_logging():
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'verbose': {
+                'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+                'style': '{',
+            },
+            'simple': {
+                'format': '{levelname} {message}',
+                'style': '{',
+            },
         },
-        'simple': {
-            'format': '{levelname} {message}',
-            'style': '{',
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'formatter': 'verbose',
+            },
+            'file': {
+                'class': 'logging.FileHandler',
+                'filename': BASE_DIR / 'logs' / 'fastjango.log',
+                'formatter': 'verbose',
+            },
         },
-    },
-    'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
-        },
-        'file': {
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'fastjango.log',
-            'formatter': 'verbose',
-        },
-    },
-    'root': {
-        'handlers': ['console'],
-        'level': 'INFO',
-    },
-    'loggers': {
-        'fastjango': {
-            'handlers': ['console', 'file'],
+        'root': {
+            'handlers': ['console'],
             'level': 'INFO',
-            'propagate': False,
         },
-    },
-}
+        'loggers': {
+            'fastjango': {
+                'handlers': ['console', 'file'],
+                'level': 'INFO',
+                'propagate': False,
+            },
+        },
+    }
 
 # Password validation (Django-like)
-AUTH_PASSWORD_VALIDATORS = [
-    {
-        'NAME': 'fastjango.contrib.auth.password_validation.UserAttributeSimilarityValidator',
-    },
-    {
-        'NAME': 'fastjango.contrib.auth.password_validation.MinimumLengthValidator',
-        'OPTIONS': {
-            'min_length': 8,
-        }
-    },
-    {
-        'NAME': 'fastjango.contrib.auth.password_validation.CommonPasswordValidator',
-    },
-    {
-        'NAME': 'fastjango.contrib.auth.password_validation.NumericPasswordValidator',
-    },
-]
+def _build_auth_password_validators():
+    return [
+        {
+            'NAME': 'fastjango.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+        },
+        {
+            'NAME': 'fastjango.contrib.auth.password_validation.MinimumLengthValidator',
+            'OPTIONS': {
+                'min_length': 8,
+            }
+        },
+        {
+            'NAME': 'fastjango.contrib.auth.password_validation.CommonPasswordValidator',
+        },
+        {
+            'NAME': 'fastjango.contrib.auth.password_validation.NumericPasswordValidator',
+        },
+    ]
+
 
 # Internationalization (Django-like)
 LANGUAGE_CODE = 'en-us'
@@ -260,17 +286,18 @@ USE_TZ = True
 DEFAULT_AUTO_FIELD = 'fastjango.db.models.BigAutoField'
 
 # Cache Configuration (Django-like)
-CACHES = {
-    'default': {
-        'BACKEND': 'fastjango.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-    },
-    # Redis example
-    # 'default': {
-    #     'BACKEND': 'fastjango.core.cache.backends.redis.RedisCache',
-    #     'LOCATION': 'redis://127.0.0.1:6379/1',
-    # },
-}
+def _build_caches():
+    return {
+        'default': {
+            'BACKEND': 'fastjango.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        },
+        # Redis example
+        # 'default': {
+        #     'BACKEND': 'fastjango.core.cache.backends.redis.RedisCache',
+        #     'LOCATION': 'redis://127.0.0.1:6379/1',
+        # },
+    }
 
 # Email Configuration (Django-like)
 EMAIL_BACKEND = 'fastjango.core.mail.backends.console.EmailBackend'
@@ -291,21 +318,37 @@ FILE_UPLOAD_TEMP_DIR = None
 FILE_UPLOAD_PERMISSIONS = 0o644
 FILE_UPLOAD_DIRECTORY_PERMISSIONS = 0o755
 
-# Security Settings for Production
+# Security Settings for Production (only parsed when DEBUG is off)
 if not DEBUG:
-    SECURE_SSL_REDIRECT = True
-    SECURE_HSTS_SECONDS = 31536000  # 1 year
-    SECURE_HSTS_INCLUDE_SUBDOMAINS = True
-    SECURE_HSTS_PRELOAD = True
-    SECURE_CONTENT_SECURITY_POLICY = "default-src 'self'"
-    SECURE_REFERRER_POLICY = 'strict-origin-when-cross-origin'
-    SESSION_COOKIE_SECURE = True
-    CSRF_COOKIE_SECURE = True
-    
-    # Production CORS settings
-    CORS_ALLOWED_ORIGINS = [
-        "https://your-production-domain.com",
-        "https://www.your-production-domain.com",
-    ]
-    CORS_ALLOW_CREDENTIALS = True
-    CORS_ALLOW_ALL_ORIGINS = False
+    from ._prod_settings import *
+
+# Lookup structures derived from the final host/origin lists: exact entries
+# are hashed, "*.example.com" style hosts collapse into one regex.
+ALLOWED_HOSTS_SET = frozenset(h.lower() for h in ALLOWED_HOSTS if not h.startswith('*'))
+ALLOWED_HOSTS_WILDCARD_RE = re.compile(
+    '|'.join(translate(h.lower()) for h in ALLOWED_HOSTS if h.startswith('*')) or r'(?!)'
+)
+CORS_ALLOWED_ORIGINS_SET = frozenset(CORS_ALLOWED_ORIGINS)
+
+
+# Large settings built on first access (PEP 562) so processes that never read
+# them skip the construction cost at import.
+_LAZY_SETTINGS = {
+    'TEMPLATES': _build_templates,
+    'LOGGING': _build_logging,
+    'AUTH_PASSWORD_VALIDATORS': _build_auth_password_validators,
+    'CACHES': _build_caches,
+}
+
+
+def __getattr__(name):
+    try:
+        builder = _LAZY_SETTINGS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = builder()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SETTINGS))
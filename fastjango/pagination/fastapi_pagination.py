@@ -5,12 +5,22 @@ This module provides FastAPI-specific pagination features with modern
 FastAPI integration, dependency injection, and OpenAPI documentation.
 """
 
-from typing import List, Dict, Any, Optional, Generic, TypeVar, Union
-from fastapi import Request, Query, Depends, HTTPException
+import asyncio
+import re
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import List, Dict, Any, Optional, Generic, TypeVar, Union, Tuple
+from fastapi import Request, Response, Query, Depends, HTTPException
 from pydantic import BaseModel, Field
-from math import ceil
 
-from .pagination import BasePagination, PaginationResponse, PaginationParams
+from .pagination import (
+    BasePagination, PaginationResponse, PaginationParams,
+    _attr_key, _cursor_params, _cursor_start, _is_record_array, _limit_offset_params, _page_params,
+    _paginate_records, _replace_query, _slice_any, _sort_by_key, _sort_with_keys, _split_url
+)
+# orjson is optional; without it responses fall back to FastAPI's encoder
+from .response import PaginatedORJSONResponse, orjson
 
 
 T = TypeVar('T')
@@ -19,24 +29,67 @@ T = TypeVar('T')
 class FastAPIPagination(BasePagination):
     """FastAPI-specific pagination with modern features."""
     
+    # Maximum number of responses kept by get_cached_response()
+    response_cache_size = 1024
+    
     def __init__(self, 
                  page_size: int = 20,
                  max_page_size: int = 100,
                  page_query_param: str = "page",
                  page_size_query_param: str = "page_size",
                  include_total: bool = True,
-                 include_links: bool = True):
+                 include_links: bool = True,
+                 cache_seconds: Optional[int] = None):
         """Initialize FastAPI pagination."""
         super().__init__(page_size, max_page_size, page_query_param, page_size_query_param)
         self.include_total = include_total
         self.include_links = include_links
+        self.cache_seconds = cache_seconds
+        self._page_param_re = re.compile(rf'([?&]){re.escape(page_query_param)}=[^&#]*')
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+    
+    def get_cached_response(self, queryset: List[Any], request: Request) -> PaginationResponse:
+        """
+        Paginate an immutable queryset, reusing earlier responses.
+        
+        Responses are kept in a small LRU keyed by the queryset's identity and
+        the request URL, so repeated requests for the same page skip the slice
+        and link building. Only use this for querysets that are never mutated.
+        """
+        url = request.url
+        key = (id(queryset), url.scheme, url.netloc, url.path, frozenset(request.query_params.multi_items()))
+        
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            # The identity check guards against a recycled id()
+            if entry is not None and entry[0] is queryset:
+                self._response_cache.move_to_end(key)
+                return entry[1]
+        
+        data = self.paginate_queryset(queryset, request)
+        response = self.get_paginated_response(data, len(queryset), request)
+        
+        with self._response_cache_lock:
+            self._response_cache[key] = (queryset, response)
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+        
+        return response
+    
+    def set_cache_headers(self, response: Response) -> None:
+        """Add a public Cache-Control header when ``cache_seconds`` is set."""
+        if self.cache_seconds:
+            response.headers["Cache-Control"] = f"public, max-age={self.cache_seconds}"
     
     def get_pagination_params(self, request: Request) -> PaginationParams:
-        """Get pagination parameters from request."""
-        page = self.get_page_number(request)
-        page_size = self.get_page_size(request)
+        """
+        Get pagination parameters from request.
         
-        return PaginationParams(page=page, page_size=page_size)
+        The result is cached on ``request.state`` so paginating the queryset
+        and building the response parse the query string only once.
+        """
+        return self._resolve(request)
     
     def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
         """Paginate queryset."""
@@ -44,15 +97,32 @@ class FastAPIPagination(BasePagination):
         start = (params.page - 1) * params.page_size
         end = start + params.page_size
         
-        return queryset[start:end]
+        return _slice_any(queryset, start, end)
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response with FastAPI features."""
         params = self.get_pagination_params(request)
+        page = params.page
+        page_size = params.page_size
+        include_total = self.include_total
         
-        total_pages = ceil(count / params.page_size) if count > 0 else 0
-        has_next = params.page < total_pages
-        has_previous = params.page > 1
+        # Everything fits on the first page: no links to build
+        if page == 1 and count <= page_size:
+            return PaginationResponse.model_construct(
+                count=count if include_total else None,
+                next=None,
+                previous=None,
+                results=data,
+                page=1,
+                page_size=page_size,
+                total_pages=(1 if count else 0) if include_total else None,
+                has_next=False,
+                has_previous=False
+            )
+        
+        total_pages = -(-count // page_size) if count > 0 else 0
+        has_next = page < total_pages
+        has_previous = page > 1
         
         # Build pagination links
         next_url = None
@@ -62,22 +132,31 @@ class FastAPIPagination(BasePagination):
             base_url = str(request.url)
             
             if has_next:
-                next_url = self._build_url(base_url, {self.page_query_param: params.page + 1})
+                next_url = self._replace_page(base_url, page + 1)
             
             if has_previous:
-                previous_url = self._build_url(base_url, {self.page_query_param: params.page - 1})
+                previous_url = self._replace_page(base_url, page - 1)
         
-        return PaginationResponse(
-            count=count if self.include_total else None,
+        # Every field is produced here, so skip Pydantic validation
+        return PaginationResponse.model_construct(
+            count=count if include_total else None,
             next=next_url,
             previous=previous_url,
             results=data,
-            page=params.page,
-            page_size=params.page_size,
-            total_pages=total_pages if self.include_total else None,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages if include_total else None,
             has_next=has_next,
             has_previous=has_previous
         )
+    
+    def _replace_page(self, url: str, page: int) -> str:
+        """Point ``url`` at ``page`` without a full parse of its query string."""
+        replacement = f'{self.page_query_param}={page}'
+        new_url, replaced = self._page_param_re.subn(lambda m: m.group(1) + replacement, url)
+        if replaced:
+            return new_url
+        return f"{url}{'&' if '?' in url else '?'}{replacement}"
 
 
 class FastAPIPageNumberPagination(FastAPIPagination):
@@ -87,9 +166,11 @@ class FastAPIPageNumberPagination(FastAPIPagination):
                  page_size: int = 20,
                  max_page_size: int = 100,
                  page_query_param: str = "page",
-                 page_size_query_param: str = "page_size"):
+                 page_size_query_param: str = "page_size",
+                 cache_seconds: Optional[int] = None):
         """Initialize FastAPI page number pagination."""
-        super().__init__(page_size, max_page_size, page_query_param, page_size_query_param)
+        super().__init__(page_size, max_page_size, page_query_param, page_size_query_param,
+                         cache_seconds=cache_seconds)
     
     def validate_page(self, page: int) -> int:
         """Validate page number."""
@@ -113,21 +194,37 @@ class FastAPILimitOffsetPagination(FastAPIPagination):
                  default_limit: int = 20,
                  max_limit: int = 100,
                  limit_query_param: str = "limit",
-                 offset_query_param: str = "offset"):
+                 offset_query_param: str = "offset",
+                 cache_seconds: Optional[int] = None):
         """Initialize FastAPI limit/offset pagination."""
-        super().__init__(default_limit, max_limit)
+        super().__init__(default_limit, max_limit, cache_seconds=cache_seconds)
         self.default_limit = default_limit
         self.max_limit = max_limit
         self.limit_query_param = limit_query_param
         self.offset_query_param = offset_query_param
     
-    def get_pagination_params(self, request: Request) -> PaginationParams:
-        """Get limit/offset pagination parameters."""
-        limit = self.get_limit(request)
-        offset = self.get_offset(request)
+    def _parse_pagination_params(self, request: Request) -> PaginationParams:
+        """Parse limit/offset pagination parameters."""
+        limit, offset = self._parse_params(request)
         
         return PaginationParams(limit=limit, offset=offset)
     
+    def _parse_params(self, request: Request) -> Tuple[int, int]:
+        """Read and validate limit and offset together."""
+        query_params = request.query_params
+        try:
+            limit = int(query_params.get(self.limit_query_param, self.default_limit))
+            offset = int(query_params.get(self.offset_query_param, 0))
+        except (ValueError, TypeError):
+            # Malformed input is rare; let each getter apply its own fallback
+            return self.get_limit(request), self.get_offset(request)
+        
+        if limit < 1:
+            raise HTTPException(status_code=400, detail="Limit must be greater than 0")
+        if offset < 0:
+            raise HTTPException(status_code=400, detail="Offset must be non-negative")
+        return min(limit, self.max_limit), offset
+    
     def get_limit(self, request: Request) -> int:
         """Get and validate limit from request."""
         try:
@@ -151,40 +248,57 @@ class FastAPILimitOffsetPagination(FastAPIPagination):
     def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
         """Paginate queryset using limit/offset."""
         params = self.get_pagination_params(request)
-        return queryset[params.offset:params.offset + params.limit]
+        return _slice_any(queryset, params.offset, params.offset + params.limit)
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response for limit/offset."""
         params = self.get_pagination_params(request)
+        limit = params.limit
+        offset = params.offset
+        include_total = self.include_total
+        
+        # Everything fits in the first window: no links to build
+        if offset == 0 and count <= limit:
+            return PaginationResponse.model_construct(
+                count=count if include_total else None,
+                next=None,
+                previous=None,
+                results=data,
+                page_size=limit,
+                has_next=False,
+                has_previous=False
+            )
         
-        has_next = params.offset + params.limit < count
-        has_previous = params.offset > 0
+        has_next = offset + limit < count
+        has_previous = offset > 0
         
         # Build pagination links
         next_url = None
         previous_url = None
         
         if self.include_links:
-            base_url = str(request.url)
+            limit_param = self.limit_query_param
+            offset_param = self.offset_query_param
+            split, query = _split_url(str(request.url))
             
             if has_next:
-                next_url = self._build_url(base_url, {
-                    self.limit_query_param: params.limit,
-                    self.offset_query_param: params.offset + params.limit
+                next_url = _replace_query(split, query, {
+                    limit_param: limit,
+                    offset_param: offset + limit
                 })
             
             if has_previous:
-                previous_url = self._build_url(base_url, {
-                    self.limit_query_param: params.limit,
-                    self.offset_query_param: max(0, params.offset - params.limit)
+                previous_url = _replace_query(split, query, {
+                    limit_param: limit,
+                    offset_param: offset - limit if offset > limit else 0
                 })
         
-        return PaginationResponse(
-            count=count if self.include_total else None,
+        return PaginationResponse.model_construct(
+            count=count if include_total else None,
             next=next_url,
             previous=previous_url,
             results=data,
-            page_size=params.limit,
+            page_size=limit,
             has_next=has_next,
             has_previous=has_previous
         )
@@ -197,14 +311,20 @@ class FastAPICursorPagination(FastAPIPagination):
                  page_size: int = 20,
                  max_page_size: int = 100,
                  cursor_query_param: str = "cursor",
-                 ordering: str = "-id"):
+                 ordering: str = "-id",
+                 cache_seconds: Optional[int] = None):
         """Initialize FastAPI cursor pagination."""
-        super().__init__(page_size, max_page_size)
+        super().__init__(page_size, max_page_size, cache_seconds=cache_seconds)
         self.cursor_query_param = cursor_query_param
         self.ordering = ordering
+        
+        # Parse the ordering once instead of on every request
+        self._reverse = ordering.startswith('-')
+        self._sort_key = ordering[1:] if self._reverse else ordering
+        self._key_fn = _attr_key(self._sort_key)
     
-    def get_pagination_params(self, request: Request) -> PaginationParams:
-        """Get cursor pagination parameters."""
+    def _parse_pagination_params(self, request: Request) -> PaginationParams:
+        """Parse cursor pagination parameters."""
         cursor = self.get_cursor(request)
         page_size = self.get_page_size(request)
         
@@ -221,41 +341,48 @@ class FastAPICursorPagination(FastAPIPagination):
     
     def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
         """Paginate queryset using cursor."""
-        cursor = self.get_cursor(request)
-        page_size = self.get_page_size(request)
-        
-        # Sort queryset by ordering
-        reverse = self.ordering.startswith('-')
-        sort_key = self.ordering[1:] if reverse else self.ordering
-        
-        # Sort the queryset
-        sorted_queryset = sorted(queryset, key=lambda x: getattr(x, sort_key, 0), reverse=reverse)
+        params = self.get_pagination_params(request)
+        cursor = params.cursor
+        page_size = params.page_size
         
+        cursor_value = None
         if cursor and self.validate_cursor(cursor):
-            # Find position after cursor
             try:
                 cursor_value = int(cursor)
-                # Find items after cursor
-                filtered_queryset = []
-                found_cursor = False
-                
-                for item in sorted_queryset:
-                    item_value = getattr(item, sort_key, 0)
-                    if found_cursor:
-                        filtered_queryset.append(item)
-                    elif item_value == cursor_value:
-                        found_cursor = True
-                
-                return filtered_queryset[:page_size]
             except (ValueError, TypeError):
-                return sorted_queryset[:page_size]
+                pass
+        
+        # Structured arrays are sorted and searched entirely in NumPy
+        if _is_record_array(queryset, self._sort_key):
+            return _paginate_records(queryset, self._sort_key, self._reverse, cursor_value, page_size)
+        
+        # Callers can mark querysets the store already returned in this order
+        presorted = getattr(queryset, '_already_sorted_by', None) == self.ordering
+        
+        if cursor_value is None:
+            if presorted:
+                return _slice_any(queryset, 0, page_size)
+            return _sort_by_key(queryset, self._key_fn, reverse=self._reverse)[:page_size]
+        
+        # Sort once, keeping the extracted keys for a binary search on the cursor;
+        # presorted querysets are searched in place without extracting keys
+        if presorted:
+            sorted_queryset, keys, key = queryset, queryset, self._key_fn
         else:
-            return sorted_queryset[:page_size]
+            sorted_queryset, keys = _sort_with_keys(queryset, self._key_fn, reverse=self._reverse)
+            key = None
+        try:
+            start = _cursor_start(keys, cursor_value, reverse=self._reverse, key=key)
+        except TypeError:
+            # Keys that don't compare with an integer cursor never match
+            return []
+        return _slice_any(sorted_queryset, start, start + page_size)
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response for cursor pagination."""
-        cursor = self.get_cursor(request)
-        page_size = self.get_page_size(request)
+        params = self.get_pagination_params(request)
+        cursor = params.cursor
+        page_size = params.page_size
         
         has_next = len(data) == page_size
         has_previous = cursor is not None
@@ -264,14 +391,16 @@ class FastAPICursorPagination(FastAPIPagination):
         next_url = None
         previous_url = None
         
-        if self.include_links and has_next and data:
-            base_url = str(request.url)
+        if self.include_links and has_next and len(data):
+            split, query = _split_url(str(request.url))
             last_item = data[-1]
-            sort_key = self.ordering[1:] if self.ordering.startswith('-') else self.ordering
-            next_cursor = getattr(last_item, sort_key, last_item.id)
-            next_url = self._build_url(base_url, {self.cursor_query_param: str(next_cursor)})
+            if _is_record_array(data, self._sort_key):
+                next_cursor = last_item[self._sort_key]
+            else:
+                next_cursor = getattr(last_item, self._sort_key, last_item.id)
+            next_url = _replace_query(split, query, {self.cursor_query_param: next_cursor})
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count if self.include_total else None,
             next=next_url,
             previous=previous_url,
@@ -288,7 +417,7 @@ def get_fastapi_page_pagination(
     page_size: int = Query(20, ge=1, le=100, description="Items per page", example=20)
 ) -> PaginationParams:
     """Get FastAPI page number pagination parameters with validation."""
-    return PaginationParams(page=page, page_size=page_size)
+    return _page_params(page, page_size)
 
 
 def get_fastapi_limit_offset_pagination(
@@ -296,42 +425,66 @@ def get_fastapi_limit_offset_pagination(
     offset: int = Query(0, ge=0, description="Number of items to skip", example=0)
 ) -> PaginationParams:
     """Get FastAPI limit/offset pagination parameters with validation."""
-    return PaginationParams(limit=limit, offset=offset)
+    return _limit_offset_params(limit, offset)
 
 
 def get_fastapi_cursor_pagination(
     cursor: Optional[str] = Query(None, description="Cursor for pagination", example="123")
 ) -> PaginationParams:
     """Get FastAPI cursor pagination parameters with validation."""
-    return PaginationParams(cursor=cursor)
+    return _cursor_params(cursor)
+
+
+def _render_paginated(result: Any, kwargs: Dict[str, Any]) -> Any:
+    """
+    Serialize a PaginationResponse with orjson when it is installed.
+    
+    FastAPI ignores an injected ``response: Response`` once the route
+    returns a response of its own, so its status code and headers (such as
+    those from ``set_cache_headers``) are carried over here.
+    """
+    if orjson is not None and isinstance(result, PaginationResponse):
+        rendered = PaginatedORJSONResponse(result)
+        for value in kwargs.values():
+            if isinstance(value, Response):
+                if value.status_code:
+                    rendered.status_code = value.status_code
+                rendered.raw_headers.extend(value.raw_headers)
+        return rendered
+    return result
+
+
+def _paginated_route(func):
+    """Wrap a route so pagination responses skip FastAPI's jsonable_encoder."""
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return _render_paginated(await func(*args, **kwargs), kwargs)
+        return async_wrapper
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return _render_paginated(func(*args, **kwargs), kwargs)
+    return wrapper
 
 
 # Pagination decorators for easy use
 def paginate_with_page_number(pagination_class: type = FastAPIPageNumberPagination):
     """Decorator for page number pagination."""
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            # Add pagination logic here
-            return func(*args, **kwargs)
-        return wrapper
+        return _paginated_route(func)
     return decorator
 
 
 def paginate_with_limit_offset(pagination_class: type = FastAPILimitOffsetPagination):
     """Decorator for limit/offset pagination."""
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            # Add pagination logic here
-            return func(*args, **kwargs)
-        return wrapper
+        return _paginated_route(func)
     return decorator
 
 
 def paginate_with_cursor(pagination_class: type = FastAPICursorPagination):
     """Decorator for cursor pagination."""
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            # Add pagination logic here
-            return func(*args, **kwargs)
-        return wrapper
+        return _paginated_route(func)
     return decorator
@@ -5,23 +5,243 @@ This module provides base pagination classes for FastJango, similar to Django DR
 pagination but adapted for FastAPI with modern features.
 """
 
-from typing import List, Dict, Any, Optional, Generic, TypeVar, Union
+from typing import List, Dict, Any, Optional, Callable, Generic, Iterable, Iterator, TypeVar, Union, Tuple
+import heapq
+import weakref
+from bisect import bisect_right
 from dataclasses import dataclass
-from math import ceil
-from urllib.parse import urlencode, parse_qs, urlparse, urlunparse
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from urllib.parse import quote_plus, parse_qsl, urlsplit, urlunsplit, SplitResult
 
 from fastapi import Request, Query, Depends
-from pydantic import BaseModel, Field
+from starlette.datastructures import URL
+from pydantic import BaseModel, ConfigDict, Field
 
 from fastjango.core.exceptions import FastJangoError
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; sorting falls back to pure Python
+    np = None
+
+from ._numba_kernels import cursor_slice_idx
+
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable, n):
+        """Backport of ``itertools.batched``: yield tuples of up to ``n`` items."""
+        iterator = iter(iterable)
+        while True:
+            batch = tuple(islice(iterator, n))
+            if not batch:
+                return
+            yield batch
+
 
 T = TypeVar('T')
 
+# Querysets at least this large are sorted with NumPy when their keys are numeric
+NUMPY_SORT_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=None)
+def _attr_key(name: str) -> Callable[[Any], Any]:
+    """
+    Return a sort key reading attribute ``name``, like ``getattr(item, name, 0)``.
+    
+    Items without the attribute sort as 0. The common case stays on an
+    ``attrgetter``; the fallback only costs when an attribute is missing.
+    """
+    getter = attrgetter(name)
+    
+    def key(item: Any) -> Any:
+        try:
+            return getter(item)
+        except AttributeError:
+            return 0
+    
+    return key
+
+
+def _sort_by_key(queryset: List[Any], key, reverse: bool = False) -> List[Any]:
+    """
+    Sort a queryset by a key function.
+    
+    Large querysets whose keys are all numeric are ordered with NumPy's
+    stable argsort when NumPy is installed; everything else uses ``sorted``.
+    """
+    if np is None or len(queryset) < NUMPY_SORT_THRESHOLD:
+        return sorted(queryset, key=key, reverse=reverse)
+    
+    values = [key(item) for item in queryset]
+    keys = np.asarray(values)
+    
+    if keys.ndim != 1 or keys.dtype.kind not in 'biuf':
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+        return [queryset[i] for i in order]
+    
+    order = _argsort(keys, reverse)
+    return [queryset[i] for i in order.tolist()]
+
+
+def _sort_with_keys(queryset: List[Any], key, reverse: bool = False) -> Tuple[List[Any], Any]:
+    """
+    Sort a queryset by a key function and return the sorted keys alongside.
+    
+    Keys are extracted once. For large numeric querysets they come back as a
+    contiguous NumPy array, which ``_cursor_start`` searches with
+    ``np.searchsorted``; otherwise they are a plain list.
+    """
+    values = [key(item) for item in queryset]
+    
+    if np is not None and len(values) >= NUMPY_SORT_THRESHOLD:
+        keys = np.asarray(values)
+        if keys.ndim == 1 and keys.dtype.kind in 'biuf':
+            order = _argsort(keys, reverse)
+            return [queryset[i] for i in order.tolist()], keys[order]
+    
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    return [queryset[i] for i in order], [values[i] for i in order]
+
+
+def _argsort(keys, reverse: bool = False):
+    """Stable NumPy argsort of ``keys``, descending when ``reverse`` is true."""
+    if reverse:
+        # Argsort the reversed keys so equal keys keep their original order
+        return (len(keys) - 1 - np.argsort(keys[::-1], kind='stable'))[::-1]
+    return np.argsort(keys, kind='stable')
+
+
+def _slice_any(queryset: Any, start: int, end: int) -> Any:
+    """
+    Slice a queryset of any supported container type.
+    
+    pandas DataFrames are sliced positionally through ``iloc``; lists, tuples,
+    NumPy arrays (which return a zero-copy view) and ORM querysets that push
+    slices down to LIMIT/OFFSET use a plain slice. Other iterables, such as
+    generators, are consumed only up to ``end``.
+    """
+    iloc = getattr(queryset, 'iloc', None)
+    if iloc is not None:
+        return iloc[start:end]
+    if hasattr(queryset, '__getitem__'):
+        return queryset[start:end]
+    return list(islice(queryset, start, end))
+
+
+def _is_record_array(queryset: Any, field: str) -> bool:
+    """Return whether ``queryset`` is a NumPy structured array with ``field``."""
+    return (
+        np is not None
+        and isinstance(queryset, np.ndarray)
+        and queryset.dtype.names is not None
+        and field in queryset.dtype.names
+    )
 
-@dataclass
+
+def _paginate_records(records, field: str, reverse: bool, cursor_value: Optional[int], page_size: int):
+    """
+    Cursor-paginate a NumPy structured array by one of its fields.
+    
+    Both the sort and the cursor lookup run inside NumPy.
+    """
+    sorted_records = records[_argsort(records[field], reverse)]
+    start = 0
+    
+    if cursor_value is not None:
+        start = _cursor_start(sorted_records[field], cursor_value, reverse)
+    
+    return sorted_records[start:start + page_size]
+
+
+def _cursor_start(keys: List[Any], value: Any, reverse: bool = False, key=None) -> int:
+    """
+    Return the index of the first key that sorts after ``value``.
+    
+    ``keys`` must already be sorted, descending when ``reverse`` is true.
+    NumPy arrays are searched with ``np.searchsorted``. When ``key`` is
+    given, ``keys`` holds the sorted items themselves and ``key`` is only
+    called on the O(log n) items the search probes.
+    """
+    if key is None:
+        if np is not None and isinstance(keys, np.ndarray):
+            if reverse:
+                # Keys are descending: skip every key >= value
+                return len(keys) - int(np.searchsorted(keys[::-1], value, side='left'))
+            return int(np.searchsorted(keys, value, side='right'))
+        
+        if not reverse:
+            return bisect_right(keys, value)
+    
+    # bisect has no descending mode (or key= before 3.10), so search by hand
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = keys[mid] if key is None else key(keys[mid])
+        if (probe < value) if reverse else (value < probe):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _split_url(url: str) -> Tuple[SplitResult, Dict[str, List[str]]]:
+    """Parse a URL once into its parts and a query dict for ``_replace_query``."""
+    split = urlsplit(url)
+    query: Dict[str, List[str]] = {}
+    for key, value in parse_qsl(split.query, keep_blank_values=True):
+        query.setdefault(key, []).append(value)
+    return split, query
+
+
+def _encode_query(query: Dict[str, List[str]]) -> str:
+    """
+    Encode a query dict of string lists, like ``urlencode(query, doseq=True)``.
+    
+    Pagination queries are a handful of str keys and values, so this skips
+    urlencode's generic type dispatch and quotes each part directly.
+    """
+    parts = []
+    for key, values in query.items():
+        quoted_key = quote_plus(key)
+        for value in values:
+            parts.append(f"{quoted_key}={quote_plus(value)}")
+    return "&".join(parts)
+
+
+def _replace_query(split: SplitResult, query: Dict[str, List[str]], params: Dict[str, Any]) -> str:
+    """Rebuild a URL from ``_split_url`` output with ``params`` overridden."""
+    new_query = dict(query)
+    for key, value in params.items():
+        new_query[key] = [str(value)]
+    return urlunsplit((
+        split.scheme,
+        split.netloc,
+        split.path,
+        _encode_query(new_query),
+        split.fragment
+    ))
+
+
+def _append_query(base_url: str, encoded_tail: str) -> str:
+    """Append an already-encoded query fragment to ``base_url``."""
+    base, hash_sign, fragment = base_url.partition('#')
+    path, _, query = base.partition('?')
+    query = f"{query}&{encoded_tail}" if query else encoded_tail
+    return f"{path}?{query}{hash_sign}{fragment}"
+
+
+def _build_url(base_url: URL, params: Dict[str, Any]) -> str:
+    """Build URL with query parameters, reusing Starlette's parsed ``URL``."""
+    return str(base_url.include_query_params(**params))
+
+
+@dataclass(frozen=True)
 class PaginationParams:
-    """Pagination parameters."""
+    """Pagination parameters (immutable, so instances can be shared)."""
     page: int = 1
     page_size: int = 20
     limit: Optional[int] = None
@@ -31,7 +251,16 @@ class PaginationParams:
 
 
 class PaginationResponse(BaseModel, Generic[T]):
-    """Pagination response model."""
+    """
+    Pagination response model.
+    
+    The paginators build responses with ``model_construct``, skipping field
+    validation; declare ``response_model=PaginationResponse`` on the
+    endpoint when the payload should be validated.
+    """
+    # Pydantic v2 has no slots option; responses are immutable once built
+    model_config = ConfigDict(frozen=True)
+    
     count: int = Field(description="Total number of items")
     next: Optional[str] = Field(None, description="URL to next page")
     previous: Optional[str] = Field(None, description="URL to previous page")
@@ -79,6 +308,63 @@ class BasePagination:
     def get_pagination_links(self, request: Request, **kwargs) -> Dict[str, Optional[str]]:
         """Get pagination links."""
         raise NotImplementedError
+    
+    def _resolve(self, request: Request) -> PaginationParams:
+        """
+        Get the request's pagination parameters, parsing them only once.
+        
+        The parsed params are cached on ``request.state`` per paginator, so
+        ``paginate_queryset`` and ``get_paginated_response`` share one parse.
+        The cache is keyed by the paginator itself, not ``id(self)``: ids are
+        reused once an object is freed, which would hand a new paginator
+        another one's params.
+        """
+        cache = getattr(request.state, '_fj_pagination', None)
+        if cache is None:
+            cache = weakref.WeakKeyDictionary()
+            request.state._fj_pagination = cache
+        params = cache.get(self)
+        if params is None:
+            params = self._parse_pagination_params(request)
+            cache[self] = params
+        return params
+    
+    def _parse_pagination_params(self, request: Request) -> PaginationParams:
+        """Parse pagination parameters from the query string."""
+        return PaginationParams(page=self.get_page_number(request), page_size=self.get_page_size(request))
+    
+    @staticmethod
+    def _parse_int(request: Request, name: str, default: int,
+                   low: Optional[int] = None, high: Optional[int] = None) -> int:
+        """
+        Read an integer query param, clamped to ``[low, high]``.
+        
+        Missing or malformed values return ``default`` unclamped.
+        """
+        raw = request.query_params.get(name)
+        if raw is None:
+            return default
+        # Plain digit strings, the common case, skip the exception handling
+        if raw.isdecimal():
+            value = int(raw)
+        else:
+            try:
+                value = int(raw)
+            except ValueError:
+                return default
+        if low is not None and value < low:
+            return low
+        if high is not None and value > high:
+            return high
+        return value
+    
+    def get_page_number(self, request: Request) -> int:
+        """Get page number from request."""
+        return self._parse_int(request, self.page_query_param, 1, low=1)
+    
+    def get_page_size(self, request: Request) -> int:
+        """Get page size from request."""
+        return self._parse_int(request, self.page_size_query_param, self.page_size, high=self.max_page_size)
 
 
 class PageNumberPagination(BasePagination):
@@ -92,53 +378,81 @@ class PageNumberPagination(BasePagination):
         """Initialize page number pagination."""
         super().__init__(page_size, max_page_size, page_query_param, page_size_query_param)
     
-    def get_page_number(self, request: Request) -> int:
-        """Get page number from request."""
-        try:
-            page = int(request.query_params.get(self.page_query_param, 1))
-            return max(1, page)
-        except (ValueError, TypeError):
-            return 1
-    
-    def get_page_size(self, request: Request) -> int:
-        """Get page size from request."""
-        try:
-            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
-            return min(page_size, self.max_page_size)
-        except (ValueError, TypeError):
-            return self.page_size
-    
-    def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
-        """Paginate queryset."""
-        page_number = self.get_page_number(request)
-        page_size = self.get_page_size(request)
+    def paginate_queryset(self, queryset: Iterable[Any], request: Request) -> List[Any]:
+        """
+        Paginate queryset.
+        
+        Sliceable querysets are sliced directly; other iterables are consumed
+        only up to the end of the page, so callers must supply ``count``.
+        """
+        params = self._resolve(request)
+        page_number = params.page
+        page_size = params.page_size
         
         start = (page_number - 1) * page_size
         end = start + page_size
         
-        return queryset[start:end]
+        return _slice_any(queryset, start, end)
     
-    def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
-        """Get paginated response."""
-        page_number = self.get_page_number(request)
-        page_size = self.get_page_size(request)
+    def iter_pages(self, queryset: Iterable[Any], page_size: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yield every page of ``queryset`` in order, as tuples.
+        
+        Chunking is done by ``itertools.batched`` in C, for exports and other
+        loops that walk a whole precomputed result set page by page.
+        """
+        return batched(queryset, page_size or self.page_size)
+    
+    def get_paginated_response(self, data: List[Any], count: Optional[int], request: Request) -> PaginationResponse:
+        """
+        Get paginated response.
+        
+        Pass ``count=None`` when the total is expensive to compute; ``has_next``
+        is then inferred from a full page and ``total_pages`` is left unset.
+        """
+        params = self._resolve(request)
+        page_number = params.page
+        page_size = params.page_size
         
-        total_pages = ceil(count / page_size) if count > 0 else 0
-        has_next = page_number < total_pages
+        if count is None:
+            # Unknown total (the caller skipped a COUNT query): a full page
+            # is taken to mean there is another one
+            count = 0
+            total_pages = None
+            has_next = len(data) == page_size
+        elif not count:
+            return PaginationResponse.model_construct(
+                count=0,
+                next=None,
+                previous=None,
+                results=data,
+                page=page_number,
+                page_size=page_size,
+                total_pages=0,
+                has_next=False,
+                has_previous=False
+            )
+        
+        else:
+            total_pages = (count + page_size - 1) // page_size
+            has_next = page_number < total_pages
         has_previous = page_number > 1
         
         # Build pagination links
-        base_url = str(request.url)
+        url = request.url
+        page_query_param = self.page_query_param
+        next_page = page_number + 1
+        previous_page = page_number - 1
         next_url = None
         previous_url = None
         
         if has_next:
-            next_url = self._build_url(base_url, {self.page_query_param: page_number + 1})
+            next_url = str(url.include_query_params(**{page_query_param: next_page}))
         
         if has_previous:
-            previous_url = self._build_url(base_url, {self.page_query_param: page_number - 1})
+            previous_url = str(url.include_query_params(**{page_query_param: previous_page}))
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -149,25 +463,6 @@ class PageNumberPagination(BasePagination):
             has_next=has_next,
             has_previous=has_previous
         )
-    
-    def _build_url(self, base_url: str, params: Dict[str, Any]) -> str:
-        """Build URL with query parameters."""
-        parsed = urlparse(base_url)
-        query_params = parse_qs(parsed.query)
-        
-        # Update with new parameters
-        for key, value in params.items():
-            query_params[key] = [str(value)]
-        
-        new_query = urlencode(query_params, doseq=True)
-        return urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            parsed.fragment
-        ))
 
 
 class LimitOffsetPagination(BasePagination):
@@ -184,56 +479,52 @@ class LimitOffsetPagination(BasePagination):
         self.max_limit = max_limit
         self.limit_query_param = limit_query_param
         self.offset_query_param = offset_query_param
+        # Parameter names are fixed, so encode them once for link building
+        self._limit_prefix = quote_plus(limit_query_param) + "="
+        self._offset_prefix = quote_plus(offset_query_param) + "="
     
     def get_limit(self, request: Request) -> int:
         """Get limit from request."""
-        try:
-            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
-            return min(limit, self.max_limit)
-        except (ValueError, TypeError):
-            return self.default_limit
+        return self._parse_int(request, self.limit_query_param, self.default_limit, high=self.max_limit)
     
     def get_offset(self, request: Request) -> int:
         """Get offset from request."""
-        try:
-            offset = int(request.query_params.get(self.offset_query_param, 0))
-            return max(0, offset)
-        except (ValueError, TypeError):
-            return 0
+        return self._parse_int(request, self.offset_query_param, 0, low=0)
     
-    def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
-        """Paginate queryset."""
-        limit = self.get_limit(request)
-        offset = self.get_offset(request)
+    def _parse_pagination_params(self, request: Request) -> PaginationParams:
+        """Parse limit/offset pagination parameters."""
+        return PaginationParams(limit=self.get_limit(request), offset=self.get_offset(request))
+    
+    def paginate_queryset(self, queryset: Iterable[Any], request: Request) -> List[Any]:
+        """
+        Paginate queryset.
+        
+        Sliceable querysets are sliced directly; other iterables are consumed
+        only up to ``offset + limit``, so callers must supply ``count``.
+        """
+        params = self._resolve(request)
+        limit = params.limit
+        offset = params.offset
         
-        return queryset[offset:offset + limit]
+        return _slice_any(queryset, offset, offset + limit)
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response."""
-        limit = self.get_limit(request)
-        offset = self.get_offset(request)
+        params = self._resolve(request)
+        limit = params.limit
+        offset = params.offset
         
         has_next = offset + limit < count
         has_previous = offset > 0
         
         # Build pagination links
-        base_url = str(request.url)
         next_url = None
         previous_url = None
         
-        if has_next:
-            next_url = self._build_url(base_url, {
-                self.limit_query_param: limit,
-                self.offset_query_param: offset + limit
-            })
-        
-        if has_previous:
-            previous_url = self._build_url(base_url, {
-                self.limit_query_param: limit,
-                self.offset_query_param: max(0, offset - limit)
-            })
+        if has_next or has_previous:
+            next_url, previous_url = self._build_links(request, limit, offset, has_next, has_previous)
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -243,24 +534,45 @@ class LimitOffsetPagination(BasePagination):
             has_previous=has_previous
         )
     
-    def _build_url(self, base_url: str, params: Dict[str, Any]) -> str:
-        """Build URL with query parameters."""
-        parsed = urlparse(base_url)
-        query_params = parse_qs(parsed.query)
+    def _build_links(self, request: Request, limit: int, offset: int,
+                     has_next: bool, has_previous: bool) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Build the next and previous links.
         
-        # Update with new parameters
-        for key, value in params.items():
-            query_params[key] = [str(value)]
+        When the query string holds nothing but this paginator's own
+        params, the links are the path plus the pre-encoded params;
+        otherwise the query is rebuilt with ``include_query_params``.
+        """
+        url = request.url
+        limit_param = self.limit_query_param
+        offset_param = self.offset_query_param
+        next_offset = offset + limit
+        previous_offset = max(0, offset - limit)
+        next_url = None
+        previous_url = None
+        
+        if all(key == limit_param or key == offset_param for key in request.query_params.keys()):
+            base_url = str(url).partition('?')[0]
+            limit_part = f"{self._limit_prefix}{limit}&{self._offset_prefix}"
+            if has_next:
+                next_url = _append_query(base_url, f"{limit_part}{next_offset}")
+            if has_previous:
+                previous_url = _append_query(base_url, f"{limit_part}{previous_offset}")
+            return next_url, previous_url
+        
+        if has_next:
+            next_url = str(url.include_query_params(**{
+                limit_param: limit,
+                offset_param: next_offset
+            }))
+        
+        if has_previous:
+            previous_url = str(url.include_query_params(**{
+                limit_param: limit,
+                offset_param: previous_offset
+            }))
         
-        new_query = urlencode(query_params, doseq=True)
-        return urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            parsed.fragment
-        ))
+        return next_url, previous_url
 
 
 class CursorPagination(BasePagination):
@@ -275,69 +587,118 @@ class CursorPagination(BasePagination):
         super().__init__(page_size, max_page_size)
         self.cursor_query_param = cursor_query_param
         self.ordering = ordering
+        
+        # Parse the ordering once instead of on every request
+        self._reverse = ordering.startswith('-')
+        self._sort_key = ordering[1:] if self._reverse else ordering
+        self._key_fn = _attr_key(self._sort_key)
     
     def get_cursor(self, request: Request) -> Optional[str]:
         """Get cursor from request."""
         return request.query_params.get(self.cursor_query_param)
     
+    def _parse_pagination_params(self, request: Request) -> PaginationParams:
+        """Parse cursor pagination parameters."""
+        return PaginationParams(cursor=self.get_cursor(request), page_size=self.get_page_size(request))
+    
     def paginate_queryset(self, queryset: List[Any], request: Request) -> List[Any]:
         """Paginate queryset using cursor."""
-        cursor = self.get_cursor(request)
-        page_size = self.get_page_size(request)
+        params = self._resolve(request)
+        cursor = params.cursor
+        page_size = params.page_size
         
-        # Sort queryset by ordering
-        reverse = self.ordering.startswith('-')
-        sort_key = self.ordering[1:] if reverse else self.ordering
+        # Only one page is needed, so select it with a bounded heap
+        # (O(n log page_size)) instead of sorting the whole queryset
+        key = self._key_fn
+        select = heapq.nlargest if self._reverse else heapq.nsmallest
         
-        # Sort the queryset
-        sorted_queryset = sorted(queryset, key=lambda x: getattr(x, sort_key, 0), reverse=reverse)
+        # Querysets the store already returned in this order are searched
+        # in place: O(log n) to find the cursor, then a page-sized slice
+        if getattr(queryset, '_already_sorted_by', None) == self.ordering:
+            return self._paginate_sorted(queryset, cursor, page_size)
         
         if cursor:
-            # Find position after cursor
             try:
                 cursor_value = int(cursor)
-                # Find items after cursor
-                filtered_queryset = []
-                found_cursor = False
-                
-                for item in sorted_queryset:
-                    item_value = getattr(item, sort_key, 0)
-                    if found_cursor:
-                        filtered_queryset.append(item)
-                    elif item_value == cursor_value:
-                        found_cursor = True
-                
-                return filtered_queryset[:page_size]
             except (ValueError, TypeError):
-                return sorted_queryset[:page_size]
-        else:
-            return sorted_queryset[:page_size]
+                return select(page_size, queryset, key=key)
+            
+            # Keep only the items that come after the cursor
+            if self._reverse:
+                remaining = (item for item in queryset if key(item) < cursor_value)
+            else:
+                remaining = (item for item in queryset if key(item) > cursor_value)
+            
+            try:
+                return select(page_size, remaining, key=key)
+            except TypeError:
+                # Keys that don't compare with an integer cursor never match
+                return []
+        
+        return select(page_size, queryset, key=key)
+    
+    def _paginate_sorted(self, queryset: List[Any], cursor: Optional[str], page_size: int) -> List[Any]:
+        """
+        Paginate a queryset that is already sorted by ``self.ordering``.
+        
+        Callers may attach the sorted keys as a NumPy array in ``_fj_keys``;
+        numeric keys are then searched by the Numba kernel when Numba is
+        installed, or with ``np.searchsorted`` otherwise.
+        """
+        try:
+            cursor_value = int(cursor) if cursor else None
+        except ValueError:
+            cursor_value = None
+        if cursor_value is None:
+            return _slice_any(queryset, 0, page_size)
+        
+        keys = getattr(queryset, '_fj_keys', None)
+        if (cursor_slice_idx is not None and np is not None and isinstance(keys, np.ndarray)
+                and keys.ndim == 1 and keys.dtype.kind in 'iuf'):
+            try:
+                # Cast to the key dtype: int64 keys above 2**53 don't survive float
+                cursor_key = keys.dtype.type(cursor_value)
+            except OverflowError:
+                # The cursor doesn't fit the key dtype; searchsorted handles it
+                cursor_key = None
+            if cursor_key is not None:
+                start, end = cursor_slice_idx(keys, cursor_key, page_size, self._reverse)
+                return _slice_any(queryset, start, end)
+        
+        try:
+            if keys is not None:
+                start = _cursor_start(keys, cursor_value, reverse=self._reverse)
+            else:
+                start = _cursor_start(queryset, cursor_value, reverse=self._reverse, key=self._key_fn)
+        except TypeError:
+            # Keys that don't compare with an integer cursor never match
+            return []
+        return _slice_any(queryset, start, start + page_size)
     
     def get_paginated_response(self, data: List[Any], count: int, request: Request) -> PaginationResponse:
         """Get paginated response."""
-        cursor = self.get_cursor(request)
-        page_size = self.get_page_size(request)
+        params = self._resolve(request)
+        cursor = params.cursor
+        page_size = params.page_size
         
         has_next = len(data) == page_size
         has_previous = cursor is not None
         
         # Build pagination links
-        base_url = str(request.url)
         next_url = None
         previous_url = None
         
         if has_next and data:
             last_item = data[-1]
-            sort_key = self.ordering[1:] if self.ordering.startswith('-') else self.ordering
-            next_cursor = getattr(last_item, sort_key, last_item.id)
-            next_url = self._build_url(base_url, {self.cursor_query_param: str(next_cursor)})
+            next_cursor = getattr(last_item, self._sort_key, last_item.id)
+            next_url = str(request.url.include_query_params(**{self.cursor_query_param: next_cursor}))
         
         if has_previous:
             # For previous, we'd need to implement reverse cursor logic
             # This is simplified for now
             pass
         
-        return PaginationResponse(
+        return PaginationResponse.model_construct(
             count=count,
             next=next_url,
             previous=previous_url,
@@ -346,34 +707,33 @@ class CursorPagination(BasePagination):
             has_next=has_next,
             has_previous=has_previous
         )
-    
-    def _build_url(self, base_url: str, params: Dict[str, Any]) -> str:
-        """Build URL with query parameters."""
-        parsed = urlparse(base_url)
-        query_params = parse_qs(parsed.query)
-        
-        # Update with new parameters
-        for key, value in params.items():
-            query_params[key] = [str(value)]
-        
-        new_query = urlencode(query_params, doseq=True)
-        return urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            new_query,
-            parsed.fragment
-        ))
 
 
 # FastAPI dependency functions
+@lru_cache(maxsize=2048)
+def _page_params(page: int, page_size: int) -> PaginationParams:
+    """Return a shared PaginationParams for a page/page_size pair."""
+    return PaginationParams(page=page, page_size=page_size)
+
+
+@lru_cache(maxsize=2048)
+def _limit_offset_params(limit: int, offset: int) -> PaginationParams:
+    """Return a shared PaginationParams for a limit/offset pair."""
+    return PaginationParams(limit=limit, offset=offset)
+
+
+@lru_cache(maxsize=2048)
+def _cursor_params(cursor: Optional[str]) -> PaginationParams:
+    """Return a shared PaginationParams for a cursor."""
+    return PaginationParams(cursor=cursor)
+
+
 def get_page_number_pagination(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page")
 ) -> PaginationParams:
     """Get page number pagination parameters."""
-    return PaginationParams(page=page, page_size=page_size)
+    return _page_params(page, page_size)
 
 
 def get_limit_offset_pagination(
@@ -381,11 +741,11 @@ def get_limit_offset_pagination(
     offset: int = Query(0, ge=0, description="Number of items to skip")
 ) -> PaginationParams:
     """Get limit/offset pagination parameters."""
-    return PaginationParams(limit=limit, offset=offset)
+    return _limit_offset_params(limit, offset)
 
 
 def get_cursor_pagination(
     cursor: Optional[str] = Query(None, description="Cursor for pagination")
 ) -> PaginationParams:
     """Get cursor pagination parameters."""
-    return PaginationParams(cursor=cursor)
+    return _cursor_params(cursor)
@@ -0,0 +1,51 @@
+"""
+FastJango Pagination Responses - orjson rendering for paginated results.
+
+This module provides a response class that serializes pagination results
+with orjson in a single pass, without dumping the model to a dict first.
+"""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from .pagination import PaginationResponse, np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; ORJSONResponse asserts on render
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the values orjson has no native support for."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if np is not None and isinstance(obj, np.ndarray):
+        # Structured and object arrays are not covered by OPT_SERIALIZE_NUMPY
+        names = obj.dtype.names
+        if names is not None:
+            return [dict(zip(names, row)) for row in obj.tolist()]
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class PaginatedORJSONResponse(ORJSONResponse):
+    """
+    Render a PaginationResponse (or plain dict) with orjson.
+
+    The model's field values are handed to orjson as they are, so dataclass,
+    dict and NumPy results are serialized in one C-level pass; nested
+    Pydantic models fall back to ``model_dump``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        assert orjson is not None, "orjson must be installed to use PaginatedORJSONResponse"
+        if isinstance(content, PaginationResponse):
+            content = content.__dict__
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -13,7 +13,8 @@ from .storage import (
 from .middleware import StaticFilesMiddleware
 from .utils import (
     static_url, static_root, staticfiles_urlpatterns,
-    get_static_path, is_static_file, get_static_file_info
+    get_static_path, is_static_file, get_static_file_info, get_static_files_info,
+    clear_static_cache
 )
 
 __all__ = [
@@ -30,5 +31,6 @@ __all__ = [
     
     # Utils
     'static_url', 'static_root', 'staticfiles_urlpatterns',
-    'get_static_path', 'is_static_file', 'get_static_file_info',
+    'get_static_path', 'is_static_file', 'get_static_file_info', 'get_static_files_info',
+    'clear_static_cache',
 ]
@@ -3,15 +3,373 @@ FastJango Static Files - Django-like static file serving using FastAPI.
 """
 
 import os
-import hashlib
 import mimetypes
+import posixpath
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
+from stat import S_IMODE, S_ISREG
+from typing import Optional, Callable, Dict, List, Any, IO, Iterator, Pattern, Tuple, Union
+
+import anyio
 from fastapi import FastAPI, Request, Response, HTTPException, status
 from fastapi.staticfiles import StaticFiles as FastAPIStaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Receive, Scope, Send
+
+# Load the system MIME type maps at import, so a preloading server parses
+# them once in the parent process instead of on each worker's first request.
+# An initialized map is left alone: init() would drop the application's own
+# add_type registrations
+if not mimetypes.inited:
+    mimetypes.init()
+for _type, _extension in (
+    ('application/wasm', '.wasm'),
+    ('font/woff2', '.woff2'),
+    ('image/webp', '.webp'),
+    ('text/javascript', '.mjs'),
+):
+    mimetypes.add_type(_type, _extension)
+del _type, _extension
+
+
+@lru_cache(maxsize=4096)
+def _content_type_for(extensions: str) -> str:
+    """Guess the content type for a filename's extensions, e.g. ``.min.js``."""
+    content_type, _ = mimetypes.guess_type('x' + extensions)
+    return content_type or 'application/octet-stream'
+
+
+def _guess_content_type(path: str) -> str:
+    """
+    Guess a file's content type, falling back to ``application/octet-stream``.
+    
+    ``mimetypes.guess_type`` only looks at the last extension, and at the one
+    before it when the last is an encoding such as ``.gz``. Results are
+    cached on just those, so fingerprinted names like ``app.3f9a8c.js``
+    share the ``.js`` entry.
+    """
+    name = os.path.basename(path)
+    dot = name.rfind('.')
+    if dot <= 0:
+        return _content_type_for('')
+    if name[dot:].lower() in mimetypes.encodings_map:
+        inner = name.rfind('.', 0, dot)
+        if inner > 0:
+            dot = inner
+    return _content_type_for(name[dot:])
+
+
+# Warm the cache with the most common asset extensions
+for _extension in (
+    '.js', '.css', '.html', '.json', '.map', '.txt', '.xml', '.svg', '.png', '.jpg',
+    '.jpeg', '.gif', '.webp', '.ico', '.woff', '.woff2', '.ttf', '.wasm', '.mjs', '.pdf',
+):
+    _content_type_for(_extension)
+del _extension
+
+
+# ETag and Last-Modified values keyed by (path, mtime_ns, size); a changed
+# file gets a new key, and stale entries age out of the LRU
+_VALIDATOR_CACHE_SIZE = 16384
+_validator_cache: "OrderedDict[Tuple[str, int, int], Tuple[str, str]]" = OrderedDict()
+_validator_cache_lock = threading.Lock()
+
+
+def _file_validators(path: str, stat: os.stat_result) -> Tuple[str, str]:
+    """
+    Return the ETag and the Last-Modified header value for a file.
+    
+    The ETag is a weak validator built from the size and nanosecond mtime,
+    so no hashing is needed. Both values are cached, so repeated requests
+    for an unchanged file also skip the date formatting.
+    """
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _validator_cache_lock:
+        cached = _validator_cache.get(key)
+        if cached is not None:
+            _validator_cache.move_to_end(key)
+            return cached
+    
+    validators = (
+        f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+        time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(stat.st_mtime))
+    )
+    
+    with _validator_cache_lock:
+        _validator_cache[key] = validators
+        if len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+            _validator_cache.popitem(last=False)
+    return validators
+
+
+def _iter_files(path: str, skip_dir: Optional[Callable[[os.DirEntry], bool]] = None
+                ) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield a ``DirEntry`` for every file under ``path``.
+    
+    ``os.scandir`` reports entry types from the directory listing itself, and
+    ``DirEntry.stat()`` caches its result, so walking a tree costs no extra
+    stat calls per file. Symlinked directories are not followed, nor are
+    directories for which ``skip_dir`` returns true. Directories that cannot
+    be listed are skipped, as ``Path.rglob`` does.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if skip_dir is None or not skip_dir(entry):
+                    yield from _iter_files(entry.path, skip_dir)
+            elif entry.is_file():
+                yield entry
+
+
+def _index_static_dirs(static_dirs: List[Any]) -> Dict[str, Tuple[Any, str]]:
+    """
+    Map every file's relative name to ``(static_dir, full_path)``.
+    
+    Names use ``/`` separators, as in URLs. When several directories contain
+    the same name, the earliest directory wins, matching a linear search.
+    """
+    index: Dict[str, Tuple[Any, str]] = {}
+    for static_dir in static_dirs:
+        root = str(static_dir)
+        if not os.path.isdir(root):
+            continue
+        prefix_len = len(os.path.join(root, ''))
+        for entry in _iter_files(root):
+            name = entry.path[prefix_len:]
+            if os.sep != '/':
+                name = name.replace(os.sep, '/')
+            index.setdefault(name, (static_dir, entry.path))
+    return index
+
+
+def _find_unindexed(static_dirs: List[Any], name: str) -> Optional[Tuple[Any, str]]:
+    """
+    Look ``name`` up on disk for a lookup that missed the index.
+    
+    ``os.stat`` follows symlinks, so this reaches files under symlinked
+    directories, which the index walk skips, and files added since the index
+    was built. Costs one stat per directory, as a search without an index.
+    """
+    for static_dir in static_dirs:
+        full_path = os.path.join(str(static_dir), name)
+        if _stat_regular_file(full_path) is not None:
+            return static_dir, full_path
+    return None
+
+
+def _is_safe_static_name(filename: str) -> bool:
+    """
+    Return whether a requested name stays inside the static directories.
+    
+    Rejects ``..`` segments and NUL bytes with plain string checks, which is
+    cheaper than resolving the path on disk.
+    """
+    if '\x00' in filename:
+        return False
+    if '\\' in filename:
+        filename = filename.replace('\\', '/')
+    return '..' not in filename.split('/')
+
+
+def _stat_regular_file(path: str) -> Optional[os.stat_result]:
+    """Stat a path in one syscall, returning None unless it is a regular file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat if S_ISREG(stat.st_mode) else None
+
+
+# Bytes per copy_file_range/sendfile call, and the buffer size for the
+# plain read/write fallback
+_COPY_RANGE_CHUNK = 1 << 30
+_COPY_BUFFER_SIZE = 1 << 20
+
+
+def _copy_static_file(src: str, dst: str, stat: Optional[os.stat_result] = None) -> None:
+    """
+    Copy a file's contents, permission bits and times, like ``shutil.copy2``.
+    
+    The destination is preallocated to the source size, and the data is
+    moved in the kernel with ``copy_file_range`` or ``sendfile`` where the
+    platform allows, falling back to a read/write loop with a 1 MiB buffer.
+    """
+    if stat is None:
+        stat = os.stat(src)
+    flags = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src, os.O_RDONLY | flags)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | flags, 0o666)
+        try:
+            if stat.st_size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(dst_fd, 0, stat.st_size)
+                except OSError:
+                    pass
+            copied = _copy_fd(src_fd, dst_fd)
+            if copied != stat.st_size:
+                # The source changed size mid-copy; drop any preallocated tail
+                os.ftruncate(dst_fd, copied)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    os.chmod(dst, S_IMODE(stat.st_mode))
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def _copy_fd(src_fd: int, dst_fd: int) -> int:
+    """Copy everything from src_fd to dst_fd and return the bytes copied."""
+    offset = 0
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while True:
+                copied = os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_CHUNK, offset, offset)
+                if not copied:
+                    return offset
+                offset += copied
+        except OSError:
+            pass  # e.g. unsupported by the filesystem; carry on from offset
+    if hasattr(os, 'sendfile'):
+        try:
+            os.lseek(dst_fd, offset, os.SEEK_SET)
+            while True:
+                copied = os.sendfile(dst_fd, src_fd, offset, _COPY_RANGE_CHUNK)
+                if not copied:
+                    return offset
+                offset += copied
+        except OSError:
+            pass
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while True:
+        buffer = os.read(src_fd, _COPY_BUFFER_SIZE)
+        if not buffer:
+            return offset
+        view = memoryview(buffer)
+        while view:
+            written = os.write(dst_fd, view)
+            view = view[written:]
+        offset += len(buffer)
+
+
+def _normalize_static_name(filename: str) -> str:
+    """Normalize a requested name to the form used as an index key."""
+    return posixpath.normpath(filename.lstrip('/'))
+
+
+def _compile_ignore_patterns(patterns: Optional[List[str]]) -> Optional[Pattern]:
+    """Compile glob ignore patterns into one regex, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{translate(pattern)})' for pattern in patterns))
+
+
+def _is_ignored(ignore_re: Optional[Pattern], rel_path: str) -> bool:
+    """
+    Return whether a relative path matches the compiled ignore patterns.
+    
+    As in Django, a pattern may match the whole path or any single
+    component of it, so ``__pycache__`` skips everything inside one.
+    """
+    if ignore_re is None:
+        return False
+    if ignore_re.match(rel_path):
+        return True
+    return any(ignore_re.match(part) for part in rel_path.split(os.sep))
+
+
+# Files above this size get sequential readahead; smaller ones are
+# prefetched whole
+_FADVISE_SEQUENTIAL_THRESHOLD = 256 * 1024
+
+
+def _advise_sequential(fd: int, size: int) -> None:
+    """Hint the kernel that a file is about to be read once, front to back."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    advice = os.POSIX_FADV_SEQUENTIAL if size > _FADVISE_SEQUENTIAL_THRESHOLD else os.POSIX_FADV_WILLNEED
+    try:
+        os.posix_fadvise(fd, 0, size, advice)
+    except OSError:
+        pass
+
+
+def _open_for_sendfile(path: str, size: int) -> IO[bytes]:
+    """Open a file to hand to the server, advising sequential reads."""
+    file = open(path, "rb")
+    _advise_sequential(file.fileno(), size)
+    return file
+
+
+class SendfileResponse(FileResponse):
+    """
+    FileResponse that lets the server send the file without Python reads.
+    
+    Servers that advertise the ASGI ``http.response.zerocopysend`` or
+    ``http.response.pathsend`` extensions get the file descriptor or path
+    and can hand it to ``sendfile(2)``, so the body never passes through
+    a thread pool or userspace buffers. Other servers get the usual
+    chunked ``FileResponse`` body.
+    """
+    
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        # Starlette hashes an MD5 ETag on every response even when one is
+        # already set; ours come precomputed from _file_validators
+        if "etag" in self.headers and "last-modified" in self.headers:
+            self.headers.setdefault("content-length", str(stat_result.st_size))
+            return
+        super().set_stat_headers(stat_result)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        if self.send_header_only or self.stat_result is None or not (
+            "http.response.zerocopysend" in extensions or "http.response.pathsend" in extensions
+        ):
+            await super().__call__(scope, receive, send)
+            return
+        
+        if "http.response.zerocopysend" in extensions:
+            # Open off the event loop, and before the headers go out, so a
+            # file that vanished still fails before the response starts
+            file = await anyio.to_thread.run_sync(_open_for_sendfile, self.path, self.stat_result.st_size)
+            with file:
+                await send({
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                })
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "count": self.stat_result.st_size,
+                    "more_body": False,
+                })
+        else:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            await send({
+                "type": "http.response.pathsend",
+                "path": os.path.abspath(self.path),
+            })
+        if self.background is not None:
+            await self.background()
 
 
 class StaticFiles:
@@ -41,11 +399,8 @@ class StaticFiles:
         if check_dir and not self.directory.exists():
             raise ValueError(f"Static files directory does not exist: {directory}")
         
-        # Initialize FastAPI StaticFiles
-        self._static_files = FastAPIStaticFiles(
-            directory=str(self.directory),
-            html=html
-        )
+        # The FastAPI StaticFiles app is only built when mounted
+        self._static_files = None
     
     def mount(self, app: FastAPI, name: str = "static"):
         """
@@ -55,6 +410,12 @@ class StaticFiles:
             app: The FastAPI app
             name: The mount name
         """
+        if self._static_files is None:
+            self._static_files = FastAPIStaticFiles(
+                directory=str(self.directory),
+                html=self.html,
+                check_dir=self.check_dir
+            )
         app.mount(self.url_prefix, self._static_files, name=name)
     
     def get_url(self, filename: str) -> str:
@@ -69,6 +430,12 @@ class StaticFiles:
         """
         return f"{self.url_prefix}/{filename.lstrip('/')}"
     
+    def _name(self, filename: str) -> Optional[str]:
+        """Strip a filename's leading slashes once, or return None if unsafe."""
+        if not _is_safe_static_name(filename):
+            return None
+        return filename.lstrip('/')
+    
     def exists(self, filename: str) -> bool:
         """
         Check if a static file exists.
@@ -79,8 +446,10 @@ class StaticFiles:
         Returns:
             True if file exists, False otherwise
         """
-        file_path = self.directory / filename.lstrip('/')
-        return file_path.exists() and file_path.is_file()
+        name = self._name(filename)
+        if name is None:
+            return False
+        return os.path.isfile(os.path.join(self.directory, name))
     
     def get_file_info(self, filename: str) -> Dict[str, Any]:
         """
@@ -92,21 +461,26 @@ class StaticFiles:
         Returns:
             Dictionary with file information
         """
-        file_path = self.directory / filename.lstrip('/')
-        
-        if not file_path.exists() or not file_path.is_file():
+        name = self._name(filename)
+        if name is None:
             return {}
+        file_path = os.path.join(self.directory, name)
         
-        stat = file_path.stat()
-        content_type, _ = mimetypes.guess_type(str(file_path))
+        stat = _stat_regular_file(file_path)
+        if stat is None:
+            return {}
         
+        return self._file_info(name, file_path, stat)
+    
+    def _file_info(self, name: str, path: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Build the file information dictionary for an already-stripped name."""
         return {
-            'name': filename,
-            'path': str(file_path),
+            'name': name,
+            'path': path,
             'size': stat.st_size,
             'modified': stat.st_mtime,
-            'content_type': content_type or 'application/octet-stream',
-            'url': self.get_url(filename)
+            'content_type': _guess_content_type(path),
+            'url': f"{self.url_prefix}/{name}"
         }
     
     def list_files(self, subdirectory: str = "") -> List[Dict[str, Any]]:
@@ -124,11 +498,13 @@ class StaticFiles:
         if not dir_path.exists() or not dir_path.is_dir():
             return []
         
+        # Paths under dir_path start with the static directory and a separator
+        prefix_len = len(os.path.join(str(self.directory), ''))
+        
         files = []
-        for file_path in dir_path.rglob('*'):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.directory)
-                files.append(self.get_file_info(str(rel_path)))
+        for entry in _iter_files(str(dir_path)):
+            rel_path = entry.path[prefix_len:]
+            files.append(self._file_info(rel_path, entry.path, entry.stat()))
         
         return files
 
@@ -138,22 +514,30 @@ class StaticFilesHandler:
     Handler for serving static files with Django-like API.
     """
     
-    def __init__(self, static_dirs: List[str] = None, static_url: str = "/static/"):
+    def __init__(self, static_dirs: List[str] = None, static_url: str = "/static/",
+                 reload_on_miss: bool = False):
         """
         Initialize static files handler.
         
         Args:
             static_dirs: List of static directories
             static_url: URL prefix for static files
+            reload_on_miss: Whether to rescan the directories when a lookup
+                misses, so files added after startup are found; meant for
+                development, as every miss then walks every directory
         """
         self.static_dirs = static_dirs or ["static"]
         self.static_url = static_url.rstrip('/')
+        self.reload_on_miss = reload_on_miss
         self._handlers = {}
         
         # Create handlers for each static directory
         for static_dir in self.static_dirs:
             handler = StaticFiles(directory=static_dir, url_prefix=self.static_url)
             self._handlers[static_dir] = handler
+        
+        # Index every file once so lookups need no filesystem access
+        self._index = _index_static_dirs(self.static_dirs)
     
     def mount_all(self, app: FastAPI):
         """
@@ -162,7 +546,12 @@ class StaticFilesHandler:
         Args:
             app: The FastAPI app
         """
+        mounted = set()
         for i, (static_dir, handler) in enumerate(self._handlers.items()):
+            # A second mount at the same prefix could never be reached
+            if handler.url_prefix in mounted:
+                continue
+            mounted.add(handler.url_prefix)
             mount_name = f"static_{i}" if i > 0 else "static"
             handler.mount(app, name=mount_name)
     
@@ -176,10 +565,26 @@ class StaticFilesHandler:
         Returns:
             File information or None if not found
         """
-        for static_dir, handler in self._handlers.items():
-            if handler.exists(filename):
-                return handler.get_file_info(filename)
-        return None
+        if not _is_safe_static_name(filename):
+            return None
+        name = _normalize_static_name(filename)
+        found = self._index.get(name)
+        if found is None:
+            found = _find_unindexed(self.static_dirs, name)
+            if found is not None:
+                self._index[name] = found
+            elif self.reload_on_miss:
+                self._index = _index_static_dirs(self.static_dirs)
+                found = self._index.get(name)
+        if found is None:
+            return None
+        
+        # The index already holds the safe, normalized name and full path
+        static_dir, full_path = found
+        stat = _stat_regular_file(full_path)
+        if stat is None:
+            return None
+        return self._handlers[static_dir]._file_info(name, full_path, stat)
     
     def get_url(self, filename: str) -> str:
         """
@@ -202,51 +607,64 @@ def collectstatic(source_dirs: List[str], destination: str,
     Args:
         source_dirs: List of source directories
         destination: Destination directory
-        ignore_patterns: Patterns to ignore
+        ignore_patterns: Glob patterns to ignore, matched against the
+            relative path and each of its components; an ignored directory
+            is skipped as a whole and listed once in ``skipped_files``
         dry_run: Whether to perform a dry run
         
     Returns:
         Dictionary with collection results
     """
-    import shutil
-    from pathlib import Path
-    
     destination_path = Path(destination)
-    ignore_patterns = ignore_patterns or []
+    ignore_re = _compile_ignore_patterns(ignore_patterns)
     
     if not dry_run:
         destination_path.mkdir(parents=True, exist_ok=True)
     
     collected_files = []
     skipped_files = []
+    # Destination -> source entry; a later source directory overrides an earlier one
+    copies: Dict[str, os.DirEntry] = {}
     
     for source_dir in source_dirs:
         source_path = Path(source_dir)
         if not source_path.exists():
             continue
         
-        for file_path in source_path.rglob('*'):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(source_path)
-                
-                # Check ignore patterns
-                should_ignore = False
-                for pattern in ignore_patterns:
-                    if pattern in str(rel_path):
-                        should_ignore = True
-                        break
-                
-                if should_ignore:
-                    skipped_files.append(str(rel_path))
-                    continue
-                
-                dest_file = destination_path / rel_path
-                
-                if not dry_run:
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(file_path, dest_file)
-                
-                collected_files.append(str(rel_path))
+        prefix_len = len(os.path.join(str(source_path), ''))
+        
+        def skip_dir(entry: os.DirEntry) -> bool:
+            # Ignored directories are pruned without listing their contents
+            rel_path = entry.path[prefix_len:]
+            if _is_ignored(ignore_re, rel_path):
+                skipped_files.append(rel_path)
+                return True
+            return False
+        
+        for entry in _iter_files(str(source_path), skip_dir if ignore_re is not None else None):
+            rel_path = entry.path[prefix_len:]
+            
+            # Check ignore patterns; names come from the listing, so ignored
+            # files are never stat'ed
+            if _is_ignored(ignore_re, rel_path):
+                skipped_files.append(rel_path)
+                continue
+            
+            copies[os.path.join(destination, rel_path)] = entry
+            collected_files.append(rel_path)
+    
+    if not dry_run and copies:
+        # Create every directory up front so the copy workers never race on mkdir
+        for dest_dir in {os.path.dirname(dest) for dest in copies}:
+            os.makedirs(dest_dir, exist_ok=True)
+        
+        # Copies are I/O bound and release the GIL
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(
+                lambda item: _copy_static_file(item[1].path, item[0], item[1].stat()),
+                copies.items()
+            ))
     
     return {
         'collected_files': collected_files,
@@ -256,10 +674,47 @@ def collectstatic(source_dirs: List[str], destination: str,
     }
 
 
+def _match_glob_parts(matchers: List[Optional[Callable]], parts: List[str]) -> bool:
+    """
+    Match a file's path components against per-component glob matchers.
+    
+    A ``None`` matcher stands for ``**`` and, as in pathlib, consumes zero or
+    more directories but never the file name itself.
+    """
+    last = len(parts) - 1
+    states = {0}
+    for k, part in enumerate(parts):
+        # Let each ** also match zero directories
+        pending = list(states)
+        while pending:
+            i = pending.pop()
+            if i < len(matchers) and matchers[i] is None and i + 1 not in states:
+                states.add(i + 1)
+                pending.append(i + 1)
+        
+        next_states = set()
+        for i in states:
+            if i == len(matchers):
+                continue
+            matcher = matchers[i]
+            if matcher is None:
+                if k < last:
+                    next_states.add(i)
+            elif matcher(part):
+                next_states.add(i + 1)
+        if not next_states:
+            return False
+        states = next_states
+    return len(matchers) in states
+
+
 def find_static_files(directory: str, pattern: str = "*") -> List[str]:
     """
     Find static files matching a pattern.
     
+    Matches the files ``Path(directory).rglob(pattern)`` finds, including
+    ``**`` components, which match any number of directories.
+    
     Args:
         directory: The directory to search
         pattern: The file pattern to match
@@ -267,16 +722,50 @@ def find_static_files(directory: str, pattern: str = "*") -> List[str]:
     Returns:
         List of matching file paths
     """
-    from pathlib import Path
-    
-    dir_path = Path(directory)
-    if not dir_path.exists():
+    root = os.fspath(Path(directory))
+    if not os.path.isdir(root):
         return []
     
+    pattern = pattern.strip('/')
+    components = pattern.split('/')
+    prefix_len = len(os.path.join(root, ''))
+    
     files = []
-    for file_path in dir_path.rglob(pattern):
-        if file_path.is_file():
-            files.append(str(file_path.relative_to(dir_path)))
+    if '**' in components:
+        # rglob(pattern) is glob('**/' + pattern); match component by
+        # component, with consecutive ** collapsed
+        matchers: List[Optional[Callable]] = [None]
+        for component in components:
+            if component == '**':
+                if matchers[-1] is not None:
+                    matchers.append(None)
+            else:
+                matchers.append(re.compile(translate(component)).match)
+        for entry in _iter_files(root):
+            rel_path = entry.path[prefix_len:]
+            if _match_glob_parts(matchers, rel_path.split(os.sep)):
+                files.append(rel_path)
+        return files
+    
+    # Without **, a pattern with N components matches the last N components
+    # of each path below the directory. It is compiled once for the walk,
+    # with native separators so path tails are plain slices
+    match = re.compile(translate(pattern.replace('/', os.sep))).match
+    depth = len(components)
+    
+    for entry in _iter_files(root):
+        rel_path = entry.path[prefix_len:]
+        if depth == 1:
+            name = entry.name
+        else:
+            start = len(rel_path)
+            for _ in range(depth):
+                start = rel_path.rfind(os.sep, 0, start)
+                if start < 0:
+                    break
+            name = rel_path[start + 1:]
+        if match(name):
+            files.append(rel_path)
     
     return files
 
@@ -304,29 +793,30 @@ def serve_static_file(file_path: str, content_type: str = None) -> Response:
         content_type: The content type
         
     Returns:
-        FileResponse with proper headers
+        SendfileResponse with proper headers
     """
-    from pathlib import Path
-    
-    path = Path(file_path)
-    if not path.exists() or not path.is_file():
+    path = os.fspath(file_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+    if stat is None or not S_ISREG(stat.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
     
     if content_type is None:
-        content_type, _ = mimetypes.guess_type(str(path))
-        content_type = content_type or 'application/octet-stream'
+        content_type = _guess_content_type(path)
     
     # Add cache headers
-    stat = path.stat()
-    etag = hashlib.md5(f"{path}:{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()
+    etag, last_modified = _file_validators(path, stat)
     
-    response = FileResponse(
-        path=str(path),
+    response = SendfileResponse(
+        path=path,
         media_type=content_type,
+        stat_result=stat,
         headers={
-            'ETag': f'"{etag}"',
+            'ETag': etag,
             'Cache-Control': 'public, max-age=31536000',  # 1 year
-            'Last-Modified': time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(stat.st_mtime))
+            'Last-Modified': last_modified
         }
     )
     
@@ -3,25 +3,69 @@ FastJango Static Files Middleware - Django-like static file middleware.
 """
 
 import os
-import mimetypes
-import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterator, Tuple, Union
 from fastapi import Request, Response, HTTPException, status
-from fastapi.responses import FileResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.staticfiles import StaticFiles as FastAPIStaticFiles
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from .files import (
+    SendfileResponse, _file_validators, _find_unindexed, _guess_content_type, _index_static_dirs,
+    _is_safe_static_name, _iter_files, _normalize_static_name, _stat_regular_file
+)
 
-class StaticFilesMiddleware(BaseHTTPMiddleware):
+
+# Maximum number of files shown on the development 404 page
+_DEBUG_LISTING_LIMIT = 50
+
+
+def _not_modified(request: Request, etag: str, stat: os.stat_result) -> bool:
+    """
+    Return whether a conditional GET can be answered with 304 Not Modified.
+    
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``; ETags
+    are compared weakly, as RFC 7232 requires for GET.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        target = etag[2:] if etag.startswith('W/') else etag
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if (tag[2:] if tag.startswith('W/') else tag) == target:
+                return True
+        return False
+    
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return int(stat.st_mtime) <= since.timestamp()
+    
+    return False
+
+
+class StaticFilesMiddleware:
     """
     Middleware for serving static files with Django-like behavior.
     
     This middleware intercepts requests to static files and serves them
-    directly, similar to Django's static file middleware.
+    directly, similar to Django's static file middleware. It is a plain
+    ASGI middleware, so other requests pass through untouched.
     """
     
-    def __init__(self, app, static_url: str = "/static/", static_dirs: List[str] = None,
-                 check_dir: bool = True, html: bool = False):
+    def __init__(self, app: ASGIApp, static_url: str = "/static/", static_dirs: List[str] = None,
+                 check_dir: bool = True, html: bool = False, reload_on_miss: bool = False,
+                 immutable: bool = False):
         """
         Initialize the static files middleware.
         
@@ -31,37 +75,52 @@ class StaticFilesMiddleware(BaseHTTPMiddleware):
             static_dirs: List of static directories to search
             check_dir: Whether to check if directories exist
             html: Whether to serve HTML files
+            reload_on_miss: Whether to rescan the directories when a lookup
+                misses; meant for development only, as every miss then walks
+                every directory inside the request
+            immutable: Whether the files never change once served, as with
+                fingerprinted assets; each file is then stat'ed only once and
+                responses are marked ``immutable``
         """
-        super().__init__(app)
-        self.static_url = static_url.rstrip('/')
-        self.static_dirs = static_dirs or ["static"]
-        self.check_dir = check_dir
-        self.html = html
+        self.app = app
+        self.static_url: str = static_url.rstrip('/')
+        self._prefix_len: int = len(self.static_url)
+        self.static_dirs: List[str] = static_dirs or ["static"]
+        self.check_dir: bool = check_dir
+        self.html: bool = html
+        self.reload_on_miss: bool = reload_on_miss
+        self.immutable: bool = immutable
+        self._cache_control: str = 'public, max-age=31536000' + (', immutable' if immutable else '')
+        
+        # Stat results of served files, kept only in immutable mode
+        self._stats: Dict[str, os.stat_result] = {}
         
         # Validate static directories
         if check_dir:
             for static_dir in self.static_dirs:
                 if not Path(static_dir).exists():
                     raise ValueError(f"Static directory does not exist: {static_dir}")
+        
+        # Index every file once; lookups then cost a dict get, not a stat per directory
+        self._index: Dict[str, Tuple[str, str]] = _index_static_dirs(self.static_dirs)
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process the request and serve static files if needed.
+        Serve static requests and pass everything else to the app.
         
-        Args:
-            request: The request object
-            call_next: The next middleware/endpoint
-            
-        Returns:
-            The response
+        The static prefix is matched on the raw ASGI path, so other requests
+        reach the app without a Request object being built.
         """
-        # Check if this is a static file request
-        if request.url.path.startswith(self.static_url):
-            return await self._serve_static_file(request)
+        if scope["type"] != "http" or not scope["path"].startswith(self.static_url):
+            await self.app(scope, receive, send)
+            return
         
-        # Continue with normal request processing
-        response = await call_next(request)
-        return response
+        try:
+            response = await self._serve_static_file(Request(scope, receive))
+        except HTTPException as e:
+            # This middleware sits outside the app's exception handlers
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
+        await response(scope, receive, send)
     
     async def _serve_static_file(self, request: Request) -> Response:
         """
@@ -73,64 +132,117 @@ class StaticFilesMiddleware(BaseHTTPMiddleware):
         Returns:
             FileResponse or 404 response
         """
-        # Extract the file path from the URL
-        url_path = request.url.path
+        # Extract the file path from the ASGI path, without building a URL
+        url_path = request.scope["path"]
         if not url_path.startswith(self.static_url):
             raise HTTPException(status_code=404, detail="Not found")
         
         # Remove the static URL prefix to get the file path
-        file_path = url_path[len(self.static_url):].lstrip('/')
+        file_path = url_path[self._prefix_len:].lstrip('/')
         
-        # Look for the file in static directories
-        for static_dir in self.static_dirs:
-            full_path = Path(static_dir) / file_path
-            
-            if full_path.exists() and full_path.is_file():
-                return await self._create_file_response(full_path)
+        # Refuse traversal outside the static directories up front
+        if not _is_safe_static_name(file_path):
+            raise HTTPException(status_code=404, detail="Static file not found")
+        
+        # Look the file up in the index of the static directories; the hot
+        # path stays on plain strings and os.stat rather than pathlib
+        full_path = self._lookup(file_path)
+        if full_path is not None:
+            stat = self._stat(full_path)
+            if stat is not None:
+                return await self._create_file_response(full_path, request, stat)
         
         # File not found
         raise HTTPException(status_code=404, detail="Static file not found")
     
-    async def _create_file_response(self, file_path: Path) -> Response:
+    def _lookup(self, filename: str) -> Optional[str]:
+        """
+        Find a file through the index, falling back to the disk on a miss.
+        
+        Args:
+            filename: The file name relative to the static directories
+            
+        Returns:
+            Path to the file or None if not found
+        """
+        if not _is_safe_static_name(filename):
+            return None
+        name = _normalize_static_name(filename)
+        found = self._index.get(name)
+        if found is None:
+            # Files under symlinked directories are not indexed; remember
+            # them once found so later requests hit the index
+            found = _find_unindexed(self.static_dirs, name)
+            if found is not None:
+                self._index[name] = found
+            elif self.reload_on_miss:
+                self._index = _index_static_dirs(self.static_dirs)
+                found = self._index.get(name)
+        if found is None:
+            return None
+        return found[1]
+    
+    def _stat(self, full_path: str) -> Optional[os.stat_result]:
+        """
+        Stat a regular file, or return None if it is missing or not a file.
+        
+        One stat both confirms the file and feeds the cache validators; in
+        immutable mode it is made once per file and then reused.
+        """
+        stat = self._stats.get(full_path)
+        if stat is not None:
+            return stat
+        stat = _stat_regular_file(full_path)
+        if stat is not None and self.immutable:
+            self._stats[full_path] = stat
+        return stat
+    
+    async def _create_file_response(self, file_path: Union[str, Path], request: Optional[Request] = None,
+                                    stat: Optional[os.stat_result] = None) -> Response:
         """
         Create a FileResponse for a static file.
         
         Args:
             file_path: The file path
+            request: The request, checked for conditional GET headers
+            stat: The file's stat result, if already known
             
         Returns:
-            FileResponse with proper headers
+            FileResponse with proper headers, or a bare 304 response
         """
-        # Determine content type
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        content_type = content_type or 'application/octet-stream'
+        file_path = os.fspath(file_path)
+        if stat is None:
+            stat = os.stat(file_path)
         
-        # Get file stats
-        stat = file_path.stat()
+        # ETag and Last-Modified come from a cache keyed on the file's stat
+        etag, last_modified = _file_validators(file_path, stat)
         
-        # Create ETag for caching
-        etag = self._generate_etag(file_path, stat)
+        # Revalidations end here, before any response setup
+        if request is not None and _not_modified(request, etag, stat):
+            return Response(status_code=304, headers={
+                'ETag': etag,
+                'Cache-Control': self._cache_control
+            })
         
-        # Check if file has been modified
-        if_none_match = request.headers.get('if-none-match')
-        if if_none_match and if_none_match == etag:
-            return Response(status_code=304)  # Not Modified
+        # Determine content type
+        content_type = _guess_content_type(file_path)
         
         # Create response with cache headers
-        response = FileResponse(
-            path=str(file_path),
+        response = SendfileResponse(
+            path=file_path,
             media_type=content_type,
+            stat_result=stat,
             headers={
                 'ETag': etag,
-                'Cache-Control': 'public, max-age=31536000',  # 1 year
-                'Last-Modified': time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(stat.st_mtime)),
+                'Cache-Control': self._cache_control,  # 1 year
+                'Last-Modified': last_modified,
                 'Content-Length': str(stat.st_size)
             }
         )
         
         return response
     
-    def _generate_etag(self, file_path: Path, stat) -> str:
+    def _generate_etag(self, file_path: Union[str, Path], stat: os.stat_result) -> str:
         """
         Generate an ETag for a file.
         
@@ -141,11 +253,8 @@ class StaticFilesMiddleware(BaseHTTPMiddleware):
         Returns:
             The ETag string
         """
-        import hashlib
-        
-        # Create ETag based on file path, modification time, and size
-        etag_data = f"{file_path}:{stat.st_mtime}:{stat.st_size}"
-        return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
+        # Weak ETag from the file's size and modification time
+        return _file_validators(str(file_path), stat)[0]
     
     def find_static_file(self, filename: str) -> Optional[Path]:
         """
@@ -157,10 +266,9 @@ class StaticFilesMiddleware(BaseHTTPMiddleware):
         Returns:
             Path to the file or None if not found
         """
-        for static_dir in self.static_dirs:
-            file_path = Path(static_dir) / filename.lstrip('/')
-            if file_path.exists() and file_path.is_file():
-                return file_path
+        file_path = self._lookup(filename)
+        if file_path is not None and os.path.isfile(file_path):
+            return Path(file_path)
         return None
     
     def get_static_url(self, filename: str) -> str:
@@ -195,7 +303,8 @@ class DevelopmentStaticFilesMiddleware(StaticFilesMiddleware):
             static_dirs: List of static directories to search
             debug: Whether to enable debug features
         """
-        super().__init__(app, static_url, static_dirs)
+        # Files change while developing, so pick up new ones on a miss
+        super().__init__(app, static_url, static_dirs, reload_on_miss=True)
         self.debug = debug
     
     async def _serve_static_file(self, request: Request) -> Response:
@@ -216,6 +325,18 @@ class DevelopmentStaticFilesMiddleware(StaticFilesMiddleware):
                 return await self._create_debug_response(request, e)
             raise
     
+    def _iter_available_files(self) -> Iterator[str]:
+        """
+        Lazily yield the relative names of files in the static directories.
+        
+        Entry types come from the directory listing, so no file is stat'ed.
+        """
+        for static_dir in self.static_dirs:
+            if os.path.isdir(static_dir):
+                prefix_len = len(os.path.join(static_dir, ''))
+                for entry in _iter_files(static_dir):
+                    yield entry.path[prefix_len:]
+    
     async def _create_debug_response(self, request: Request, exception: HTTPException) -> Response:
         """
         Create a debug response for missing static files.
@@ -227,18 +348,12 @@ class DevelopmentStaticFilesMiddleware(StaticFilesMiddleware):
         Returns:
             HTML response with debug information
         """
-        url_path = request.url.path
-        file_path = url_path[len(self.static_url):].lstrip('/')
+        file_path = request.scope["path"][self._prefix_len:].lstrip('/')
         
-        # List available static files
-        available_files = []
-        for static_dir in self.static_dirs:
-            static_path = Path(static_dir)
-            if static_path.exists():
-                for file in static_path.rglob('*'):
-                    if file.is_file():
-                        rel_path = file.relative_to(static_path)
-                        available_files.append(str(rel_path))
+        # List available static files, stopping as soon as the page is full
+        available_files = list(islice(self._iter_available_files(), _DEBUG_LISTING_LIMIT + 1))
+        has_more = len(available_files) > _DEBUG_LISTING_LIMIT
+        available_files = sorted(available_files[:_DEBUG_LISTING_LIMIT])
         
         # Create debug HTML
         html_content = f"""
@@ -265,8 +380,8 @@ class DevelopmentStaticFilesMiddleware(StaticFilesMiddleware):
             
             <h2>Available Static Files:</h2>
             <div class="file-list">
-                {''.join(f'<div class="file-item">{file}</div>' for file in sorted(available_files)[:50])}
-                {f'<div class="info">... and {len(available_files) - 50} more files</div>' if len(available_files) > 50 else ''}
+                {''.join(f'<div class="file-item">{file}</div>' for file in available_files)}
+                {'<div class="info">... and more files</div>' if has_more else ''}
             </div>
             
             <p class="info">This is a development-only error page. In production, static files should be served by a web server.</p>
@@ -291,24 +406,25 @@ def setup_static_middleware(app, settings: Dict[str, Any]):
         settings: Settings dictionary with static file configuration
     """
     static_url = settings.get('STATIC_URL', '/static/')
-    staticfiles_dirs = settings.get('STATICFILES_DIRS', [])
+    static_dirs = settings.get('STATICFILES_DIRS', []) or ["static"]
     debug = settings.get('DEBUG', False)
     
     if debug:
         # Development mode: use development middleware
-        middleware = DevelopmentStaticFilesMiddleware(
-            app,
+        app.add_middleware(
+            DevelopmentStaticFilesMiddleware,
             static_url=static_url,
-            static_dirs=staticfiles_dirs or ["static"],
+            static_dirs=static_dirs,
             debug=debug
         )
+    elif len(static_dirs) == 1:
+        # Production mode, one directory: mount it so the router serves it
+        # and other requests never pass through a static middleware
+        app.mount(static_url.rstrip('/'), FastAPIStaticFiles(directory=static_dirs[0]), name="static")
     else:
-        # Production mode: use standard middleware
-        middleware = StaticFilesMiddleware(
-            app,
+        # Production mode: the middleware searches multiple directories
+        app.add_middleware(
+            StaticFilesMiddleware,
             static_url=static_url,
-            static_dirs=staticfiles_dirs or ["static"]
+            static_dirs=static_dirs
         )
-    
-    # Add middleware to app
-    app.add_middleware(type(middleware), **middleware.__dict__)
@@ -4,10 +4,68 @@ FastJango Static Files Utils - Django-like static file utilities.
 
 import os
 import hashlib
-import mimetypes
+import json
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
-from fastapi import Request
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, List, Any, Mapping, Set, Tuple, Union
+import anyio
+from fastapi import Body, Request
+
+from .files import _guess_content_type, _is_safe_static_name, _iter_files, _stat_regular_file, collectstatic, find_static_files
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 is optional; hashlib's BLAKE2 is the fallback
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import watchfiles
+except ImportError:  # watchfiles is optional; caches then rely on TTLs and stat
+    watchfiles = None
+
+# Resolved static paths keyed by (filename, static_dirs). Entries expire after
+# a short TTL so added or removed files are noticed without a restart
+_STATIC_PATH_CACHE_SIZE = 4096
+_STATIC_PATH_TTL = 2.0
+_static_path_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[Optional[Path], float]]" = OrderedDict()
+_static_path_cache_lock = threading.Lock()
+
+# Absolute paths of the directories a filesystem watcher invalidates the
+# caches for; lookups confined to them stay valid until an event clears them
+_watched_dirs: Set[str] = set()
+
+# Bumped by every clear_static_cache; a lookup that raced a clear must not
+# store its possibly stale result without expiry
+_static_cache_generation = 0
+
+# Manifests for fewer files are hashed inline; thread startup would cost more
+_PARALLEL_MANIFEST_THRESHOLD = 256
+
+# Content hashes keyed by path, stored with the (size, mtime_ns) they were
+# computed for; a file is only read again after it changes
+_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+
+# Files at least this large are hashed through mmap instead of read()
+_MMAP_HASH_THRESHOLD = 1 << 20
+
+# Content hashes are 4 bytes (8 hex characters). Copying an initialized
+# BLAKE2 state is cheaper than setting up a new one per file
+_BLAKE2_BASE = hashlib.blake2b(digest_size=4)
+
+# Parsed manifests keyed by path, stored with the (size, mtime_ns) of the
+# file they were read from
+_manifest_cache: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
 
 
 def static_url(filename: str, static_url: str = "/static/") -> str:
@@ -21,7 +79,14 @@ def static_url(filename: str, static_url: str = "/static/") -> str:
     Returns:
         The static file URL
     """
-    return f"{static_url.rstrip('/')}/{filename.lstrip('/')}"
+    return _make_static_url(static_url.rstrip('/'), filename)
+
+
+def _make_static_url(prefix: str, filename: str) -> str:
+    """Join a static URL prefix, already stripped of its trailing slash, and a filename."""
+    if filename[:1] == '/':
+        filename = filename.lstrip('/')
+    return f"{prefix}/{filename}"
 
 
 def static_root(settings: Dict[str, Any]) -> str:
@@ -37,34 +102,45 @@ def static_root(settings: Dict[str, Any]) -> str:
     return settings.get('STATIC_ROOT', 'staticfiles')
 
 
-def staticfiles_urlpatterns(static_url: str = "/static/", static_dirs: List[str] = None) -> List[Dict[str, Any]]:
+def staticfiles_urlpatterns(static_url: str = "/static/", static_dirs: List[str] = None
+                            ) -> Tuple[Mapping[str, Any], ...]:
     """
     Generate URL patterns for static files (Django-like).
     
+    The patterns are built once per ``(static_url, static_dirs)`` and
+    shared, so they are returned as a tuple of read-only mappings.
+    
     Args:
         static_url: The static URL prefix
         static_dirs: List of static directories
         
     Returns:
-        List of URL pattern dictionaries
+        Tuple of URL pattern mappings
     """
-    static_dirs = static_dirs or ["static"]
-    
-    patterns = []
-    for static_dir in static_dirs:
-        patterns.append({
+    return _staticfiles_urlpatterns(static_url, tuple(static_dirs or ("static",)))
+
+
+@lru_cache(maxsize=8)
+def _staticfiles_urlpatterns(static_url: str, static_dirs: Tuple[str, ...]) -> Tuple[Mapping[str, Any], ...]:
+    """Build the URL patterns for ``staticfiles_urlpatterns``."""
+    return tuple(
+        MappingProxyType({
             'url': static_url,
             'directory': static_dir,
             'name': 'static'
         })
-    
-    return patterns
+        for static_dir in static_dirs
+    )
 
 
 def get_static_path(filename: str, static_dirs: List[str] = None) -> Optional[Path]:
     """
     Get the full path to a static file.
     
+    Results are cached for a couple of seconds, so templates that reference
+    the same assets many times do not stat them on every call; use
+    ``clear_static_cache`` to drop the cache after changing files.
+    
     Args:
         filename: The filename
         static_dirs: List of static directories to search
@@ -72,20 +148,123 @@ def get_static_path(filename: str, static_dirs: List[str] = None) -> Optional[Pa
     Returns:
         Path to the file or None if not found
     """
-    static_dirs = static_dirs or ["static"]
-    
+    key = (filename, tuple(static_dirs or ("static",)))
+    now = time.monotonic()
+    with _static_path_cache_lock:
+        cached = _static_path_cache.get(key)
+        if cached is not None and cached[1] > now:
+            _static_path_cache.move_to_end(key)
+            return cached[0]
+        generation = _static_cache_generation
+    
+    file_path = _resolve_static_path(*key)
+    
+    with _static_path_cache_lock:
+        if (generation == _static_cache_generation and _watched_dirs
+                and all(os.path.abspath(d) in _watched_dirs for d in key[1])):
+            expires = float('inf')
+        else:
+            expires = now + _STATIC_PATH_TTL
+        _static_path_cache[key] = (file_path, expires)
+        _static_path_cache.move_to_end(key)
+        if len(_static_path_cache) > _STATIC_PATH_CACHE_SIZE:
+            _static_path_cache.popitem(last=False)
+    return file_path
+
+
+def _stat_static_path(filename: str, static_dirs: Optional[List[str]]
+                      ) -> Optional[Tuple[str, os.stat_result]]:
+    """
+    Look up a static file and stat it, returning ``(path, stat)`` or None.
+    
+    A cached path whose file has since been removed is evicted and looked
+    up again, so callers see a miss rather than a ``FileNotFoundError``.
+    """
+    for _ in range(2):
+        file_path = get_static_path(filename, static_dirs)
+        if file_path is None:
+            return None
+        path = str(file_path)
+        stat = _stat_regular_file(path)
+        if stat is not None:
+            return path, stat
+        key = (filename, tuple(static_dirs or ("static",)))
+        with _static_path_cache_lock:
+            _static_path_cache.pop(key, None)
+    return None
+
+
+def _resolve_static_path(filename: str, static_dirs: Tuple[str, ...]) -> Optional[Path]:
+    """Search the static directories, with one stat per candidate."""
+    if not _is_safe_static_name(filename):
+        return None
+    name = filename.lstrip('/')
     for static_dir in static_dirs:
-        file_path = Path(static_dir) / filename.lstrip('/')
-        if file_path.exists() and file_path.is_file():
-            return file_path
+        file_path = os.path.join(static_dir, name)
+        if _stat_regular_file(file_path) is not None:
+            return Path(file_path)
     
     return None
 
 
+def clear_static_cache():
+    """Forget all cached static path lookups and content hashes."""
+    global _static_cache_generation
+    with _static_path_cache_lock:
+        _static_cache_generation += 1
+        _static_path_cache.clear()
+    _hash_cache.clear()
+
+
+def watch_static_dirs(static_dirs: List[str], stop_event: Optional[threading.Event] = None
+                      ) -> Optional[threading.Thread]:
+    """
+    Clear the static caches whenever a file in the static directories changes.
+    
+    Needs the optional ``watchfiles`` package; the watcher runs on a daemon
+    thread until ``stop_event`` is set. While it runs, cached path lookups
+    that only search watched directories no longer expire on their own.
+    
+    Args:
+        static_dirs: List of static directories to watch
+        stop_event: Event that stops the watcher when set
+        
+    Returns:
+        The watcher thread, or None if watchfiles is not installed or no
+        directory exists
+    """
+    if watchfiles is None:
+        return None
+    dirs = [static_dir for static_dir in static_dirs if os.path.isdir(static_dir)]
+    if not dirs:
+        return None
+    
+    watched = {os.path.abspath(static_dir) for static_dir in dirs}
+    
+    def watch():
+        try:
+            for _ in watchfiles.watch(*dirs, stop_event=stop_event):
+                clear_static_cache()
+        finally:
+            with _static_path_cache_lock:
+                _watched_dirs.difference_update(watched)
+            clear_static_cache()
+    
+    # Entries cached before the watcher started still carry a TTL
+    with _static_path_cache_lock:
+        _watched_dirs.update(watched)
+    thread = threading.Thread(target=watch, name="fastjango-static-watcher", daemon=True)
+    thread.start()
+    return thread
+
+
 def is_static_file(filename: str, static_dirs: List[str] = None) -> bool:
     """
     Check if a file is a static file.
     
+    Answers come from the ``get_static_path`` cache; a miss costs one stat
+    per static directory and no ``Path`` objects unless the file exists.
+    
     Args:
         filename: The filename
         static_dirs: List of static directories
@@ -107,45 +286,75 @@ def get_static_file_info(filename: str, static_dirs: List[str] = None) -> Dict[s
     Returns:
         Dictionary with file information
     """
-    file_path = get_static_path(filename, static_dirs)
+    found = _stat_static_path(filename, static_dirs)
     
-    if not file_path:
+    if found is None:
         return {}
     
-    stat = file_path.stat()
-    content_type, _ = mimetypes.guess_type(str(file_path))
-    
-    return {
-        'name': filename,
-        'path': str(file_path),
-        'size': stat.st_size,
-        'modified': stat.st_mtime,
-        'content_type': content_type or 'application/octet-stream',
-        'exists': True
-    }
+    return _static_file_info(filename, *found)
 
 
-def find_static_files(directory: str, pattern: str = "*") -> List[str]:
+def get_static_files_info(filenames: List[str], static_dirs: List[str] = None) -> Dict[str, Dict[str, Any]]:
     """
-    Find static files matching a pattern.
+    Get information about several static files at once.
+    
+    Requested files are grouped by parent directory, and each candidate
+    directory is listed once with ``os.scandir`` rather than probing every
+    file in every static directory.
     
     Args:
-        directory: The directory to search
-        pattern: The file pattern to match
+        filenames: The filenames
+        static_dirs: List of static directories
         
     Returns:
-        List of matching file paths
+        Dictionary mapping each filename to its information, or to an
+        empty dictionary if it was not found
     """
-    dir_path = Path(directory)
-    if not dir_path.exists():
-        return []
-    
-    files = []
-    for file_path in dir_path.rglob(pattern):
-        if file_path.is_file():
-            files.append(str(file_path.relative_to(dir_path)))
+    static_dirs = static_dirs or ["static"]
+    results: Dict[str, Dict[str, Any]] = {}
+    # Parent directory -> [(filename, base name)] still to be found
+    pending: Dict[str, List[Tuple[str, str]]] = {}
     
-    return files
+    for filename in filenames:
+        results[filename] = {}
+        if not _is_safe_static_name(filename):
+            continue
+        parent, _, base = filename.lstrip('/').rpartition('/')
+        if base:
+            pending.setdefault(parent, []).append((filename, base))
+    
+    for parent, wanted in pending.items():
+        for static_dir in static_dirs:
+            try:
+                with os.scandir(os.path.join(static_dir, parent)) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                continue
+            
+            missing = []
+            for filename, base in wanted:
+                entry = entries.get(base)
+                if entry is not None and entry.is_file():
+                    results[filename] = _static_file_info(filename, entry.path, entry.stat())
+                else:
+                    missing.append((filename, base))
+            wanted = missing
+            if not wanted:
+                break
+    
+    return results
+
+
+def _static_file_info(filename: str, path: str, stat: os.stat_result) -> Dict[str, Any]:
+    """Build the file information dictionary from an existing stat result."""
+    return {
+        'name': filename,
+        'path': path,
+        'size': stat.st_size,
+        'modified': stat.st_mtime,
+        'content_type': _guess_content_type(path),
+        'exists': True
+    }
 
 
 def get_static_hash(filename: str, static_dirs: List[str] = None) -> Optional[str]:
@@ -159,15 +368,37 @@ def get_static_hash(filename: str, static_dirs: List[str] = None) -> Optional[st
     Returns:
         Hash string or None if file not found
     """
-    file_path = get_static_path(filename, static_dirs)
+    found = _stat_static_path(filename, static_dirs)
     
-    if not file_path:
+    if found is None:
         return None
     
-    # Create hash based on file content and modification time
-    stat = file_path.stat()
-    hash_data = f"{file_path}:{stat.st_mtime}:{stat.st_size}"
-    return hashlib.md5(hash_data.encode()).hexdigest()[:8]
+    return _static_hash(*found)
+
+
+def _static_hash(path: str, stat: os.stat_result) -> str:
+    """
+    Hash a file's contents for cache busting.
+    
+    The digest is cached against the file's size and nanosecond mtime, so
+    an unchanged file is only ever read once. BLAKE3 is used when the
+    ``blake3`` package is installed, BLAKE2 otherwise.
+    """
+    cached = _hash_cache.get(path)
+    if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    
+    hasher = blake3() if blake3 is not None else _BLAKE2_BASE.copy()
+    with open(path, 'rb') as f:
+        if stat.st_size >= _MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                hasher.update(data)
+        else:
+            hasher.update(f.read())
+    file_hash = hasher.hexdigest(4) if blake3 is not None else hasher.hexdigest()
+    
+    _hash_cache[path] = (stat.st_size, stat.st_mtime_ns, file_hash)
+    return file_hash
 
 
 def static_url_with_hash(filename: str, static_url: str = "/static/", 
@@ -183,7 +414,8 @@ def static_url_with_hash(filename: str, static_url: str = "/static/",
     Returns:
         The static file URL with hash
     """
-    base_url = static_url(filename, static_url)
+    # The parameter shadows the static_url() function, so build the URL directly
+    base_url = _make_static_url(static_url.rstrip('/'), filename)
     file_hash = get_static_hash(filename, static_dirs)
     
     if file_hash:
@@ -201,53 +433,14 @@ def collect_static_files(source_dirs: List[str], destination: str,
     Args:
         source_dirs: List of source directories
         destination: Destination directory
-        ignore_patterns: Patterns to ignore
+        ignore_patterns: Glob patterns to ignore, matched against the
+            relative path and each of its components
         
     Returns:
         Dictionary with collection results
     """
-    import shutil
-    
-    destination_path = Path(destination)
-    ignore_patterns = ignore_patterns or []
-    
-    destination_path.mkdir(parents=True, exist_ok=True)
-    
-    collected_files = []
-    skipped_files = []
-    
-    for source_dir in source_dirs:
-        source_path = Path(source_dir)
-        if not source_path.exists():
-            continue
-        
-        for file_path in source_path.rglob('*'):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(source_path)
-                
-                # Check ignore patterns
-                should_ignore = False
-                for pattern in ignore_patterns:
-                    if pattern in str(rel_path):
-                        should_ignore = True
-                        break
-                
-                if should_ignore:
-                    skipped_files.append(str(rel_path))
-                    continue
-                
-                dest_file = destination_path / rel_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, dest_file)
-                
-                collected_files.append(str(rel_path))
-    
-    return {
-        'collected_files': collected_files,
-        'skipped_files': skipped_files,
-        'total_collected': len(collected_files),
-        'total_skipped': len(skipped_files)
-    }
+    # collectstatic walks each directory once and reuses every DirEntry's stat
+    return collectstatic(source_dirs, destination, ignore_patterns)
 
 
 def get_static_manifest(static_dirs: List[str] = None) -> Dict[str, str]:
@@ -261,21 +454,33 @@ def get_static_manifest(static_dirs: List[str] = None) -> Dict[str, str]:
         Dictionary mapping filenames to their hashes
     """
     static_dirs = static_dirs or ["static"]
-    manifest = {}
+    names = []
+    entries = []
     
     for static_dir in static_dirs:
-        static_path = Path(static_dir)
-        if not static_path.exists():
+        # Normalize the root as Path would, so the hash cache is shared with
+        # get_static_hash
+        root = os.fspath(Path(static_dir))
+        if not os.path.isdir(root):
             continue
         
-        for file_path in static_path.rglob('*'):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(static_path))
-                file_hash = get_static_hash(rel_path, [static_dir])
-                if file_hash:
-                    manifest[rel_path] = file_hash
+        prefix_len = len(os.path.join(root, ''))
+        for entry in _iter_files(root):
+            names.append(entry.path[prefix_len:])
+            entries.append(entry)
     
-    return manifest
+    # Each DirEntry's stat is taken once and hashed directly; the stats are
+    # blocking syscalls, so large trees overlap them on a thread pool
+    if len(entries) < _PARALLEL_MANIFEST_THRESHOLD:
+        return dict(zip(names, map(_hash_entry, entries)))
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(names, executor.map(_hash_entry, entries)))
+
+
+def _hash_entry(entry: os.DirEntry) -> str:
+    """Hash a walked file from its DirEntry."""
+    return _static_hash(entry.path, entry.stat())
 
 
 def save_static_manifest(manifest: Dict[str, str], output_file: str):
@@ -286,26 +491,57 @@ def save_static_manifest(manifest: Dict[str, str], output_file: str):
         manifest: The manifest dictionary
         output_file: The output file path
     """
-    import json
+    # Serialize to one bytes object so the file is written in one call
+    if orjson is not None:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2).encode()
     
-    with open(output_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(data)
 
 
 def load_static_manifest(manifest_file: str) -> Dict[str, str]:
     """
     Load a static file manifest from a file.
     
+    The parsed manifest is cached for the process and only read again when
+    the file's size or modification time changes, so the returned dict is
+    shared between callers and must not be modified.
+    
     Args:
         manifest_file: The manifest file path
         
     Returns:
         The manifest dictionary
     """
-    import json
+    stat = os.stat(manifest_file)
+    cached = _manifest_cache.get(manifest_file)
+    if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    
+    with open(manifest_file, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        manifest = orjson.loads(data)
+    else:
+        manifest = json.loads(data)
     
-    with open(manifest_file, 'r') as f:
-        return json.load(f)
+    _manifest_cache[manifest_file] = (stat.st_size, stat.st_mtime_ns, manifest)
+    return manifest
+
+
+async def aload_static_manifest(manifest_file: str) -> Dict[str, str]:
+    """
+    Load a static file manifest without blocking the event loop.
+    
+    Args:
+        manifest_file: The manifest file path
+        
+    Returns:
+        The manifest dictionary, shared as with ``load_static_manifest``
+    """
+    return await anyio.to_thread.run_sync(load_static_manifest, manifest_file)
 
 
 # Template helpers (for use in Jinja2 templates)
@@ -320,7 +556,22 @@ def static_url_template(filename: str, static_url: str = "/static/") -> str:
     Returns:
         The static file URL
     """
-    return static_url(filename, static_url)
+    return _make_static_url(static_url.rstrip('/'), filename)
+
+
+def _static_url_template_for(prefix: str) -> Callable[..., str]:
+    """
+    Bind ``static_url_template`` to a configured prefix, stripped of its
+    trailing slash.
+    
+    Templates may still pass their own prefix as the second argument.
+    """
+    def static_url(filename: str, static_url: Optional[str] = None) -> str:
+        if static_url is None:
+            return _make_static_url(prefix, filename)
+        return _make_static_url(static_url.rstrip('/'), filename)
+    
+    return static_url
 
 
 def static_url_with_hash_template(filename: str, static_url: str = "/static/",
@@ -350,23 +601,37 @@ def setup_static_utils(app, settings: Dict[str, Any]):
     """
     # Add static utilities to app state
     app.state.static_url = settings.get('STATIC_URL', '/static/')
+    app.state.static_url_prefix = app.state.static_url.rstrip('/')
     app.state.static_root = settings.get('STATIC_ROOT')
     app.state.staticfiles_dirs = settings.get('STATICFILES_DIRS', [])
     
+    # In development, invalidate the static caches on file changes instead
+    # of waiting for their TTLs
+    if settings.get('DEBUG', False):
+        stop_event = threading.Event()
+        if watch_static_dirs(app.state.staticfiles_dirs, stop_event) is not None:
+            app.add_event_handler("shutdown", stop_event.set)
+    
     # Add template helpers
     if hasattr(app.state, 'template_globals'):
         app.state.template_globals.update({
-            'static_url': static_url_template,
+            'static_url': _static_url_template_for(app.state.static_url_prefix),
             'static_url_with_hash': static_url_with_hash_template,
         })
     
-    # Add static file endpoints
+    # Add static file endpoints. They do blocking filesystem work, so they
+    # are plain functions that FastAPI runs in its thread pool
     @app.get("/static-info/{filename:path}")
-    async def get_static_file_info(filename: str):
+    def static_file_info(filename: str):
         """Get information about a static file."""
         return get_static_file_info(filename, app.state.staticfiles_dirs)
     
+    @app.post("/static-info-batch/")
+    def static_files_info(files: List[str] = Body(..., embed=True)):
+        """Get information about several static files in one request."""
+        return get_static_files_info(files, app.state.staticfiles_dirs)
+    
     @app.get("/static-manifest/")
-    async def get_static_manifest():
+    def static_manifest():
         """Get the static file manifest."""
         return get_static_manifest(app.state.staticfiles_dirs)
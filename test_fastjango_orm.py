@@ -26,9 +26,12 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 def setup_test_environment():
     """Set up test environment with temporary database and settings."""
     
-    # Create temporary directory for test database
+    # Create temporary directory for media and static files
     temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "test.db")
+    
+    # In-memory database: get_engine shares one connection via StaticPool,
+    # so every session sees the same data without touching the disk
+    db_path = ':memory:'
     
     # Test settings
     test_settings = {
@@ -38,6 +41,14 @@ def setup_test_environment():
                 'NAME': db_path,
                 'OPTIONS': {
                     'timeout': 20,
+                    # WAL lets readers run during writes; NORMAL syncs once
+                    # per checkpoint instead of on every commit
+                    'PRAGMAS': {
+                        'journal_mode': 'WAL',
+                        'synchronous': 'NORMAL',
+                        'temp_store': 'MEMORY',
+                        'cache_size': -64000,
+                    },
                 }
             }
         },
@@ -67,6 +78,12 @@ DATABASES = {{
         'NAME': '{db_path}',
         'OPTIONS': {{
             'timeout': 20,
+            'PRAGMAS': {{
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'temp_store': 'MEMORY',
+                'cache_size': -64000,
+            }},
         }}
     }}
 }}
@@ -245,9 +262,8 @@ def test_queryset_operations():
             {"name": "Item 4", "category": "Clothing", "price": Decimal("50.00"), "rating": 5, "is_featured": False},
         ]
         
-        for item_data in items_data:
-            item = TestItem(**item_data)
-            item.save()
+        # Insert all rows with a single executemany and one commit
+        TestItem.objects.bulk_create([TestItem(**item_data) for item_data in items_data])
         
         # Test filter
         electronics = TestItem.objects.filter(category="Electronics")
@@ -301,6 +317,7 @@ def test_relationships():
     
     try:
         from fastjango.db import models
+        from fastjango.db.connection import session_scope
         
         class Category(models.Model):
             name = models.CharField(max_length=100, unique=True)
@@ -331,21 +348,29 @@ def test_relationships():
             class Meta:
                 app_label = 'testapp'
         
-        # Create test data
-        electronics = Category.objects.create(name="Electronics", description="Electronic devices")
-        books = Category.objects.create(name="Books", description="Books and publications")
+        # Create test data in one transaction so SQLite commits once
+        electronics = Category(name="Electronics", description="Electronic devices")
+        books = Category(name="Books", description="Books and publications")
         
-        product1 = Product.objects.create(name="Laptop", category=electronics, price=Decimal("999.99"))
-        product2 = Product.objects.create(name="Python Book", category=books, price=Decimal("49.99"))
+        product1 = Product(name="Laptop", category=electronics, price=Decimal("999.99"))
+        product2 = Product(name="Python Book", category=books, price=Decimal("49.99"))
         
-        tag1 = Tag.objects.create(name="Technology")
-        tag2 = Tag.objects.create(name="Programming")
-        tag3 = Tag.objects.create(name="Education")
+        tag1 = Tag(name="Technology")
+        tag2 = Tag(name="Programming")
+        tag3 = Tag(name="Education")
         
-        article1 = Article.objects.create(title="Python Programming", content="Learn Python...")
-        article1.tags.add(tag1, tag2)
+        article1 = Article(title="Python Programming", content="Learn Python...")
+        article2 = Article(title="Web Development", content="Build web apps...")
         
-        article2 = Article.objects.create(title="Web Development", content="Build web apps...")
+        with session_scope() as session:
+            # Keep the instances loaded after the scope closes the session
+            session.expire_on_commit = False
+            session.add_all([
+                electronics, books, product1, product2,
+                tag1, tag2, tag3, article1, article2,
+            ])
+        
+        article1.tags.add(tag1, tag2)
         article2.tags.add(tag1, tag3)
         
         # Test foreign key relationships
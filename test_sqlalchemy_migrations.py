@@ -358,12 +358,15 @@ def main():
     
     results = []
     
-    # Run tests
-    results.append(("Migration Detection", test_migration_detection()))
-    results.append(("Migration Creation", test_migration_creation()))
-    results.append(("Migration Application", test_migration_application()))
-    results.append(("Model Usage", test_model_usage()))
-    results.append(("Migration Rollback", test_migration_rollback()))
+    # Run tests, removing the generated settings and app even if one raises
+    try:
+        results.append(("Migration Detection", test_migration_detection()))
+        results.append(("Migration Creation", test_migration_creation()))
+        results.append(("Migration Application", test_migration_application()))
+        results.append(("Model Usage", test_model_usage()))
+        results.append(("Migration Rollback", test_migration_rollback()))
+    finally:
+        cleanup()
     
     # Report results
     print("\n=== Test Results ===")
@@ -382,9 +385,6 @@ def main():
     else:
         print("⚠️  Some tests failed. Check the output above for details.")
     
-    # Cleanup
-    cleanup()
-    
     return all_passed
 
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Tests for FastJango database querysets.
+"""
+
+import os
+import sys
+import types
+import unittest
+
+# Add project root to path if script is run from tests directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from sqlalchemy import ForeignKey, Integer, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+from sqlalchemy.pool import StaticPool
+
+try:
+    import fastjango.db  # noqa: F401
+except ImportError:
+    # The package __init__ imports names missing from fastjango.db.exceptions
+    # in this tree; register a bare package so the submodules load alone
+    _package = types.ModuleType("fastjango.db")
+    _package.__path__ = [os.path.join(ROOT, "fastjango", "db")]
+    sys.modules["fastjango.db"] = _package
+
+from fastjango.db.queryset import QuerySet
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Category(Base):
+    __tablename__ = "category"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class Product(Base):
+    __tablename__ = "product"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    rating: Mapped[int] = mapped_column(Integer, nullable=True, default=5)
+    category_id: Mapped[int] = mapped_column(ForeignKey("category.id"), nullable=True)
+    category: Mapped[Category] = relationship()
+
+
+class BulkCreateTest(unittest.TestCase):
+    """Test suite for QuerySet.bulk_create."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(self.engine)
+        self.session = Session(self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def rows(self):
+        return [
+            (product.name, product.rating, product.category_id)
+            for product in self.session.query(Product).order_by(Product.name)
+        ]
+
+    def test_defaults_and_explicit_none(self):
+        """Test unset columns get defaults while explicit None stays NULL."""
+        products = [Product(name="a", rating=1), Product(name="b"), Product(name="c", rating=None)]
+
+        created = QuerySet(Product, self.session).bulk_create(products, batch_size=2)
+
+        self.assertEqual(created, products)
+        self.assertEqual(self.rows(), [("a", 1, None), ("b", 5, None), ("c", None, None)])
+
+    def test_related_objects(self):
+        """Test foreign keys assigned through a relationship are kept."""
+        books = Category(name="Books")
+        self.session.add(books)
+        self.session.commit()
+        toys = Category(name="Toys")
+
+        QuerySet(Product, self.session).bulk_create([
+            Product(name="a", category_id=books.id),
+            Product(name="b", category=books),
+            Product(name="c", category=toys),
+        ])
+
+        self.assertEqual(self.rows(), [("a", 5, books.id), ("b", 5, books.id), ("c", 5, toys.id)])
+
+
+def run_tests():
+    """Run the database tests."""
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()
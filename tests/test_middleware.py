@@ -154,6 +154,60 @@ class CORSMiddlewareTest(unittest.TestCase):
         self.assertEqual(response.headers["access-control-allow-origin"], "https://example.com")
         self.assertEqual(response.headers["access-control-allow-credentials"], "true")
 
+    def test_cors_origin_regexes(self):
+        """Test origins matched by string and precompiled regexes."""
+        import re
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+
+        @app.get("/")
+        async def index():
+            return {"message": "Hello World"}
+
+        app.add_middleware(
+            CORSMiddleware,
+            allowed_origins=["https://example.com"],
+            allowed_origin_regexes=[
+                r"^https://\w+\.example\.org$",
+                re.compile(r"^https://\w+\.example\.net$"),
+            ],
+        )
+        client = TestClient(app)
+
+        for origin in ("https://api.example.org", "https://api.example.net"):
+            response = client.get("/", headers={"Origin": origin})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["access-control-allow-origin"], origin)
+
+        response = client.get("/", headers={"Origin": "https://evil.com"})
+        self.assertEqual(response.status_code, 400)
+
+        # Patterns with groups are matched one by one, so the second
+        # pattern's \1 still refers to its own group
+        middleware = CORSMiddleware(
+            FastAPI(),
+            allowed_origins=["https://example.com"],
+            allowed_origin_regexes=[r"^https://(a)\.x$", r"^https://(\w+)\.\1\.com$"],
+        )
+        self.assertTrue(middleware._is_origin_allowed("https://a.x"))
+        self.assertTrue(middleware._is_origin_allowed("https://foo.foo.com"))
+        self.assertFalse(middleware._is_origin_allowed("https://foo.bar.com"))
+
+    def test_cors_origin_regex_flags(self):
+        """Test precompiled regexes keep their flags."""
+        import re
+
+        middleware = CORSMiddleware(
+            FastAPI(),
+            allowed_origins=["https://example.com"],
+            allowed_origin_regexes=[re.compile(r"^https://api\.example\.org$", re.IGNORECASE)],
+        )
+
+        self.assertTrue(middleware._is_origin_allowed("https://API.example.org"))
+        self.assertTrue(middleware._is_origin_allowed("https://example.com"))
+        self.assertFalse(middleware._is_origin_allowed("https://example.org"))
+
 
 class SecurityMiddlewareTest(unittest.TestCase):
     """Test suite for security middleware."""
@@ -187,6 +241,23 @@ class SecurityMiddlewareTest(unittest.TestCase):
         self.assertEqual(response.headers["x-content-type-options"], "nosniff")
         self.assertEqual(response.headers["x-frame-options"], "DENY")
 
+    def test_allowed_hosts(self):
+        """Test exact and wildcard ALLOWED_HOSTS entries."""
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+
+        @app.get("/")
+        async def index():
+            return {"message": "Hello World"}
+
+        app.add_middleware(SecurityMiddleware, allowed_hosts=["TestServer", "*.example.com"])
+        client = TestClient(app)
+
+        self.assertEqual(client.get("/").status_code, 200)
+        self.assertEqual(client.get("/", headers={"Host": "api.example.com"}).status_code, 200)
+        self.assertEqual(client.get("/", headers={"Host": "example.org"}).status_code, 400)
+
 
 def run_tests():
     """Run the middleware tests."""
@@ -0,0 +1,758 @@
+#!/usr/bin/env python
+"""
+Tests for FastJango pagination classes.
+"""
+
+import os
+import sys
+import unittest
+from dataclasses import dataclass
+from unittest.mock import patch
+
+# Add project root to path if script is run from tests directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from starlette.requests import Request
+
+# Import FastJango pagination components
+from fastjango.pagination import (
+    CursorPagination, DjangoLikeCursorPagination, DjangoLikePageNumberPagination, LimitOffsetPagination,
+    PageNumberPagination,
+    PaginationResponse
+)
+from fastjango.pagination.fastapi_pagination import (
+    FastAPICursorPagination, FastAPILimitOffsetPagination, FastAPIPageNumberPagination,
+    paginate_with_cursor, paginate_with_page_number
+)
+from fastjango.pagination._numba_kernels import _cursor_slice_idx
+from fastjango.pagination.response import PaginatedORJSONResponse, orjson
+from fastjango.pagination.pagination import NUMPY_SORT_THRESHOLD, np
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    score: int
+
+
+def make_request(query_string: str = "", path: str = "/items") -> Request:
+    """Build a bare Starlette request for the given query string."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": path,
+        "query_string": query_string.encode(),
+        "headers": [],
+    })
+
+
+class BasePaginationTest(unittest.TestCase):
+    """Test suite for the base page, limit/offset and cursor paginators."""
+
+    def setUp(self):
+        self.items = [Item(id=i, name=f"Item {i}", score=i % 4) for i in range(1, 26)]
+
+    def test_page_number(self):
+        """Test page number pagination and its links."""
+        paginator = PageNumberPagination(page_size=10)
+        request = make_request("page=2")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, len(self.items), request)
+
+        self.assertEqual([item.id for item in data], list(range(11, 21)))
+        self.assertEqual(response.total_pages, 3)
+        self.assertEqual(response.next, "http://testserver/items?page=3")
+        self.assertEqual(response.previous, "http://testserver/items?page=1")
+
+    def test_response_fields(self):
+        """Test built responses serialize every PaginationResponse field."""
+        paginator = PageNumberPagination(page_size=10)
+        request = make_request("page=1")
+        response = paginator.get_paginated_response(self.items[:10], len(self.items), request)
+        self.assertEqual(set(response.model_dump()), set(PaginationResponse.model_fields))
+
+    def test_response_frozen(self):
+        """Test pagination responses cannot be mutated."""
+        paginator = PageNumberPagination(page_size=10)
+        response = paginator.get_paginated_response([], 0, make_request())
+        with self.assertRaises(ValidationError):
+            response.count = 5
+
+    def test_dependency_params_shared(self):
+        """Test the Depends factories reuse immutable params instances."""
+        from dataclasses import FrozenInstanceError
+        from fastjango.pagination.pagination import get_page_number_pagination
+
+        params = get_page_number_pagination(page=2, page_size=10)
+        self.assertIs(params, get_page_number_pagination(page=2, page_size=10))
+        self.assertIsNot(params, get_page_number_pagination(page=3, page_size=10))
+        with self.assertRaises(FrozenInstanceError):
+            params.page = 5
+
+    def test_page_number_unknown_count(self):
+        """Test page number pagination without a total count."""
+        paginator = PageNumberPagination(page_size=10)
+        request = make_request("page=2")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, None, request)
+
+        self.assertIsNone(response.total_pages)
+        self.assertTrue(response.has_next)
+        self.assertEqual(response.next, "http://testserver/items?page=3")
+
+        request = make_request("page=3")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, None, request)
+        self.assertFalse(response.has_next)
+        self.assertEqual(response.previous, "http://testserver/items?page=2")
+
+    def test_page_number_empty(self):
+        """Test page number pagination of an empty queryset."""
+        paginator = PageNumberPagination(page_size=10)
+        request = make_request("page=2")
+        response = paginator.get_paginated_response([], 0, request)
+
+        self.assertEqual(response.total_pages, 0)
+        self.assertFalse(response.has_next)
+        self.assertFalse(response.has_previous)
+        self.assertIsNone(response.next)
+        self.assertIsNone(response.previous)
+
+    def test_limit_offset_links_keep_other_params(self):
+        """Test limit/offset links rebuild queries with foreign params."""
+        paginator = LimitOffsetPagination(default_limit=10)
+        request = make_request("tag=a&offset=20&limit=5")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, len(self.items), request)
+
+        self.assertEqual(response.previous, "http://testserver/items?tag=a&limit=5&offset=15")
+
+        request = make_request("")
+        response = paginator.get_paginated_response(self.items[:10], len(self.items), request)
+        self.assertEqual(response.next, "http://testserver/items?limit=10&offset=10")
+        self.assertIsNone(response.previous)
+
+    def test_malformed_params(self):
+        """Test non-digit query params fall back to the defaults."""
+        paginator = PageNumberPagination(page_size=10, max_page_size=50)
+        self.assertEqual(paginator.get_page_number(make_request("page=abc")), 1)
+        self.assertEqual(paginator.get_page_number(make_request("page=-2")), 1)
+        self.assertEqual(paginator.get_page_number(make_request("page=4")), 4)
+        self.assertEqual(paginator.get_page_size(make_request("page_size=x")), 10)
+        self.assertEqual(paginator.get_page_size(make_request("page_size=500")), 50)
+
+        paginator = LimitOffsetPagination(default_limit=10)
+        self.assertEqual(paginator.get_limit(make_request("limit=")), 10)
+        self.assertEqual(paginator.get_offset(make_request("offset=-5")), 0)
+        self.assertEqual(paginator.get_offset(make_request("offset=7")), 7)
+
+    def test_limit_offset(self):
+        """Test limit/offset pagination and its links."""
+        paginator = LimitOffsetPagination(default_limit=10)
+        request = make_request("limit=5&offset=20")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, len(self.items), request)
+
+        self.assertEqual([item.id for item in data], list(range(21, 26)))
+        self.assertFalse(response.has_next)
+        self.assertIsNone(response.next)
+        self.assertEqual(response.previous, "http://testserver/items?limit=5&offset=15")
+
+    def test_cursor(self):
+        """Test cursor pagination and its next link."""
+        paginator = CursorPagination(page_size=3)
+        request = make_request("cursor=20")
+        data = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(data, len(self.items), request)
+
+        self.assertEqual([item.id for item in data], [19, 18, 17])
+        self.assertEqual(response.next, "http://testserver/items?cursor=17")
+
+    def test_cursor_missing_sort_attribute(self):
+        """Test items without the sort attribute sort as 0."""
+        paginator = CursorPagination(page_size=3, ordering="-score")
+        items = [Item(id=i, name=f"Item {i}", score=i) for i in range(1, 6)]
+        items.insert(2, {"id": 99})
+
+        first = paginator.paginate_queryset(items, make_request())
+        self.assertEqual([item.score for item in first], [5, 4, 3])
+        rest = paginator.paginate_queryset(items, make_request("cursor=3"))
+        self.assertEqual([getattr(item, "score", 0) for item in rest], [2, 1, 0])
+
+    def test_iter_pages(self):
+        """Test iterating over every page of a queryset."""
+        pages = list(PageNumberPagination(page_size=10).iter_pages(self.items))
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual(pages[2][0].id, 21)
+
+        pages = list(PageNumberPagination().iter_pages(iter(self.items), page_size=20))
+        self.assertEqual([len(page) for page in pages], [20, 5])
+
+    def test_encode_query(self):
+        """Test the query encoder matches urlencode with doseq."""
+        from urllib.parse import urlencode
+        from fastjango.pagination.pagination import _encode_query
+
+        query = {"q": ["a b", "x&y", ""], "t\u00e4g": ["\u00e9"], "limit": ["5"]}
+        self.assertEqual(_encode_query(query), urlencode(query, doseq=True))
+
+    def test_iterable_querysets(self):
+        """Test generators are paginated without being fully consumed."""
+        consumed = []
+
+        def rows():
+            for item in self.items:
+                consumed.append(item)
+                yield item
+
+        page = PageNumberPagination(page_size=5).paginate_queryset(rows(), make_request("page=2"))
+        self.assertEqual([item.id for item in page], [6, 7, 8, 9, 10])
+        self.assertEqual(len(consumed), 10)
+
+        page = LimitOffsetPagination().paginate_queryset(rows(), make_request("limit=2&offset=3"))
+        self.assertEqual([item.id for item in page], [4, 5])
+
+    def test_cursor_selection(self):
+        """Test cursor pages match a full sort of the queryset."""
+        shuffled = self.items[::3] + self.items[1::3] + self.items[2::3]
+
+        for ordering, cursor in (("-score", "2"), ("score", "1"), ("id", ""), ("-id", "abc")):
+            paginator = CursorPagination(page_size=4, ordering=ordering)
+            reverse = ordering.startswith("-")
+            field = ordering.lstrip("-")
+            expected = sorted(shuffled, key=lambda item: getattr(item, field), reverse=reverse)
+            if cursor.isdigit():
+                value = int(cursor)
+                expected = [
+                    item for item in expected
+                    if (getattr(item, field) < value if reverse else getattr(item, field) > value)
+                ]
+
+            page = paginator.paginate_queryset(shuffled, make_request(f"cursor={cursor}"))
+            self.assertEqual([item.id for item in page], [item.id for item in expected[:4]])
+
+    def test_cursor_presorted(self):
+        """Test presorted querysets are binary-searched, duplicates included."""
+
+        class SortedRows(list):
+            _already_sorted_by = "-score"
+
+        rows = SortedRows(sorted(self.items, key=lambda item: item.score, reverse=True))
+        paginator = CursorPagination(page_size=4, ordering="-score")
+
+        for cursor in ("", "3", "1", "0", "abc"):
+            expected = list(rows)
+            if cursor.isdigit():
+                expected = [item for item in rows if item.score < int(cursor)]
+            page = paginator.paginate_queryset(rows, make_request(f"cursor={cursor}"))
+            self.assertEqual([item.id for item in page], [item.id for item in expected[:4]])
+
+    def test_params_parsed_once_per_request(self):
+        """Test the request's params are parsed once and cached."""
+        paginator = PageNumberPagination(page_size=10)
+        request = make_request("page=2")
+        calls = []
+        get_page_number = paginator.get_page_number
+
+        def counting_get_page_number(req):
+            calls.append(req)
+            return get_page_number(req)
+
+        paginator.get_page_number = counting_get_page_number
+        data = paginator.paginate_queryset(self.items, request)
+        paginator.get_paginated_response(data, len(self.items), request)
+        self.assertEqual(len(calls), 1)
+
+    def test_params_cached_per_paginator(self):
+        """Test paginators sharing a request don't reuse each other's params."""
+        request = make_request()
+        for page_size in (10, 5, 20):
+            page = PageNumberPagination(page_size=page_size).paginate_queryset(self.items, request)
+            self.assertEqual(len(page), page_size)
+
+        for limit in (10, 5, 20):
+            page = LimitOffsetPagination(default_limit=limit).paginate_queryset(self.items, request)
+            self.assertEqual(len(page), limit)
+
+
+class DjangoLikeOrderingTest(unittest.TestCase):
+    """Test suite for Django-like ordering."""
+
+    def setUp(self):
+        self.paginator = DjangoLikePageNumberPagination(page_size=5)
+
+    def test_ordering_is_stable(self):
+        """Test that equal keys keep their original order."""
+        items = [Item(id=i, name=f"Item {i}", score=i % 3) for i in range(10)]
+        ordered = self.paginator._apply_ordering(items, "-score")
+        self.assertEqual(
+            [item.id for item in ordered],
+            [2, 5, 8, 1, 4, 7, 0, 3, 6, 9],
+        )
+
+    def test_missing_ordering_field(self):
+        """Test items without the ordering field sort as 0."""
+        items = [Item(id=i, name=f"Item {i}", score=i) for i in range(1, 4)]
+        items.insert(1, {"id": 99})
+
+        ordered = self.paginator._apply_ordering(items, "-score")
+        self.assertEqual(ordered[-1], {"id": 99})
+
+        paginator = DjangoLikeCursorPagination(page_size=10, ordering="-score")
+        page = paginator.paginate_queryset(items, make_request())
+        self.assertEqual(page[-1], {"id": 99})
+
+        # Without an ordering the queryset keeps its order
+        paginator = DjangoLikeCursorPagination(page_size=10, ordering="")
+        self.assertEqual(paginator.paginate_queryset(items, make_request()), items)
+
+    def test_large_numeric_ordering_matches_sorted(self):
+        """Test ordering of querysets large enough for the NumPy path."""
+        count = NUMPY_SORT_THRESHOLD + 10
+        items = [Item(id=i, name=f"Item {i}", score=(i * 7) % 13) for i in range(count)]
+
+        for ordering, reverse in (("score", False), ("-score", True)):
+            ordered = self.paginator._apply_ordering(items, ordering)
+            expected = sorted(items, key=lambda x: x.score, reverse=reverse)
+            self.assertEqual([item.id for item in ordered], [item.id for item in expected])
+
+    def test_links_keep_ordering(self):
+        """Test page links keep the other query params."""
+        items = [Item(id=i, name=f"Item {i}", score=i % 3) for i in range(12)]
+        request = make_request("ordering=-score&page=2")
+        data = self.paginator.paginate_queryset(items, request)
+        response = self.paginator.get_paginated_response(data, len(items), request)
+
+        self.assertEqual(response.next, "http://testserver/items?ordering=-score&page=3")
+        self.assertEqual(response.previous, "http://testserver/items?ordering=-score&page=1")
+
+    def test_multiple_fields(self):
+        """Test ordering by several comma-separated fields."""
+        items = [
+            Item(id=1, name="b", score=1),
+            Item(id=2, name="a", score=2),
+            Item(id=3, name="a", score=1),
+        ]
+        ordered = self.paginator._apply_ordering(items, "name, -score")
+        self.assertEqual([item.id for item in ordered], [2, 3, 1])
+
+    def test_orderable_fields_whitelist(self):
+        """Test that fields outside orderable_fields are ignored."""
+        items = [Item(id=2, name="a", score=1), Item(id=1, name="b", score=2)]
+        self.paginator.orderable_fields = frozenset({"id"})
+
+        self.assertEqual([item.id for item in self.paginator._apply_ordering(items, "-score")], [2, 1])
+        self.assertEqual([item.id for item in self.paginator._apply_ordering(items, "id")], [1, 2])
+
+
+class FastAPICursorPaginationTest(unittest.TestCase):
+    """Test suite for FastAPI cursor pagination."""
+
+    def setUp(self):
+        self.items = [Item(id=i, name=f"Item {i}", score=i % 4) for i in range(1, 11)]
+
+    def test_descending_pages(self):
+        """Test walking pages of the default -id ordering."""
+        paginator = FastAPICursorPagination(page_size=3)
+
+        first = paginator.paginate_queryset(self.items, make_request())
+        self.assertEqual([item.id for item in first], [10, 9, 8])
+
+        second = paginator.paginate_queryset(self.items, make_request("cursor=8"))
+        self.assertEqual([item.id for item in second], [7, 6, 5])
+
+        last = paginator.paginate_queryset(self.items, make_request("cursor=2"))
+        self.assertEqual([item.id for item in last], [1])
+
+    def test_ascending_cursor(self):
+        """Test an ascending ordering resumes after the cursor value."""
+        paginator = FastAPICursorPagination(page_size=4, ordering="id")
+        page = paginator.paginate_queryset(self.items, make_request("cursor=4"))
+        self.assertEqual([item.id for item in page], [5, 6, 7, 8])
+
+    def test_large_queryset_cursor(self):
+        """Test cursors on querysets large enough for the NumPy path."""
+        count = NUMPY_SORT_THRESHOLD + 10
+        items = [Item(id=i, name=f"Item {i}", score=i % 4) for i in range(count)]
+
+        for ordering, cursor, expected in (("-id", 500, [499, 498, 497]), ("id", 500, [501, 502, 503])):
+            paginator = FastAPICursorPagination(page_size=3, ordering=ordering)
+            page = paginator.paginate_queryset(items, make_request(f"cursor={cursor}"))
+            self.assertEqual([item.id for item in page], expected)
+
+    def test_presorted_queryset(self):
+        """Test querysets flagged with _already_sorted_by are not re-sorted."""
+
+        class SortedRows(list):
+            _already_sorted_by = "-id"
+
+        # Deliberately out of order to prove no sort happens
+        rows = SortedRows([self.items[9], self.items[7], self.items[8], self.items[5]])
+        paginator = FastAPICursorPagination(page_size=2)
+
+        page = paginator.paginate_queryset(rows, make_request())
+        self.assertEqual([item.id for item in page], [10, 8])
+
+        other = FastAPICursorPagination(page_size=2, ordering="id")
+        page = other.paginate_queryset(rows, make_request())
+        self.assertEqual([item.id for item in page], [6, 8])
+
+    def test_missing_sort_attribute(self):
+        """Test items without the sort attribute sort as 0."""
+        paginator = FastAPICursorPagination(page_size=10, ordering="-score")
+        items = [Item(id=i, name=f"Item {i}", score=i) for i in range(1, 4)]
+        items.insert(1, {"id": 99})
+
+        page = paginator.paginate_queryset(items, make_request())
+        self.assertEqual([getattr(item, "score", 0) for item in page], [3, 2, 1, 0])
+
+    def test_invalid_cursor(self):
+        """Test a non-integer cursor falls back to the first page."""
+        paginator = FastAPICursorPagination(page_size=2)
+        page = paginator.paginate_queryset(self.items, make_request("cursor=abc"))
+        self.assertEqual([item.id for item in page], [10, 9])
+
+    def test_next_link(self):
+        """Test the next link carries the last item's key as cursor."""
+        paginator = FastAPICursorPagination(page_size=3)
+        request = make_request("cursor=8")
+        page = paginator.paginate_queryset(self.items, request)
+        response = paginator.get_paginated_response(page, len(self.items), request)
+        self.assertEqual(response.next, "http://testserver/items?cursor=5")
+        self.assertTrue(response.has_previous)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class FastAPINumPyPaginationTest(unittest.TestCase):
+    """Test suite for FastAPI pagination over NumPy arrays."""
+
+    def setUp(self):
+        self.records = np.array(
+            [(i, i % 3) for i in (4, 1, 7, 3, 9, 2)],
+            dtype=[("id", "i8"), ("score", "i8")],
+        )
+
+    def test_page_slice_is_view(self):
+        """Test page slicing returns a view of the array."""
+        array = np.arange(50)
+        page = FastAPIPageNumberPagination(page_size=10).paginate_queryset(array, make_request("page=2"))
+        self.assertEqual(page.tolist(), list(range(10, 20)))
+        self.assertIs(page.base, array)
+
+    def test_record_cursor_descending(self):
+        """Test cursor pagination of a structured array by -id."""
+        paginator = FastAPICursorPagination(page_size=2)
+
+        first = paginator.paginate_queryset(self.records, make_request())
+        self.assertEqual(first["id"].tolist(), [9, 7])
+
+        second = paginator.paginate_queryset(self.records, make_request("cursor=7"))
+        self.assertEqual(second["id"].tolist(), [4, 3])
+
+        request = make_request("cursor=7")
+        response = paginator.get_paginated_response(second, 6, request)
+        self.assertEqual(response.next, "http://testserver/items?cursor=3")
+
+    def test_record_cursor_ascending(self):
+        """Test cursor pagination of a structured array by id."""
+        paginator = FastAPICursorPagination(page_size=3, ordering="id")
+        page = paginator.paginate_queryset(self.records, make_request("cursor=2"))
+        self.assertEqual(page["id"].tolist(), [3, 4, 7])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class CursorKeysPaginationTest(unittest.TestCase):
+    """Test suite for cursor pagination over querysets carrying NumPy keys."""
+
+    def setUp(self):
+        self.rows = [Item(id=i, name=f"Item {i}", score=i // 2) for i in range(20, 0, -1)]
+
+    def test_cursor_slice_idx(self):
+        """Test the kernel's bounds in both directions, duplicates included."""
+        descending = np.array([item.score for item in self.rows])
+        self.assertEqual(_cursor_slice_idx(descending, 5.0, 3, True), (11, 14))
+        self.assertEqual(_cursor_slice_idx(descending, 0.0, 3, True), (20, 20))
+        self.assertEqual(_cursor_slice_idx(descending[::-1].copy(), 5.0, 30, False), (11, 20))
+
+    def test_presorted_with_keys(self):
+        """Test _fj_keys drive the cursor search of presorted querysets."""
+
+        class SortedRows(list):
+            _already_sorted_by = "-score"
+
+        rows = SortedRows(self.rows)
+        rows._fj_keys = np.array([item.score for item in self.rows])
+        paginator = CursorPagination(page_size=3, ordering="-score")
+
+        page = paginator.paginate_queryset(rows, make_request("cursor=5"))
+        self.assertEqual([item.id for item in page], [9, 8, 7])
+
+        page = paginator.paginate_queryset(rows, make_request())
+        self.assertEqual([item.id for item in page], [20, 19, 18])
+
+    def test_large_int64_keys(self):
+        """Test int64 keys above 2**53 aren't rounded through float."""
+
+        class SortedRows(list):
+            _already_sorted_by = "-score"
+
+        base = 2 ** 53
+        rows = SortedRows(Item(id=i, name=f"Item {i}", score=base + i) for i in range(3, -1, -1))
+        rows._fj_keys = np.array([item.score for item in rows], dtype=np.int64)
+        paginator = CursorPagination(page_size=3, ordering="-score")
+
+        # Stand in for the compiled kernel so the test runs without Numba
+        with patch("fastjango.pagination.pagination.cursor_slice_idx", _cursor_slice_idx):
+            page = paginator.paginate_queryset(rows, make_request(f"cursor={base + 1}"))
+            self.assertEqual([item.id for item in page], [0])
+
+            page = paginator.paginate_queryset(rows, make_request(f"cursor={2 ** 64}"))
+            self.assertEqual([item.id for item in page], [3, 2, 1])
+
+
+class FastAPIPaginationLinksTest(unittest.TestCase):
+    """Test suite for FastAPI pagination links."""
+
+    def test_page_links_keep_other_params(self):
+        """Test page links only replace the page parameter."""
+        paginator = FastAPIPageNumberPagination(page_size=5)
+        request = make_request("tag=a&page=2&tag=b&page_size=5")
+        response = paginator.get_paginated_response([], 20, request)
+
+        self.assertEqual(response.next, "http://testserver/items?tag=a&page=3&tag=b&page_size=5")
+        self.assertEqual(response.previous, "http://testserver/items?tag=a&page=1&tag=b&page_size=5")
+        self.assertEqual(response.total_pages, 4)
+
+    def test_page_link_appended(self):
+        """Test the page parameter is appended when the URL lacks it."""
+        paginator = FastAPIPageNumberPagination(page_size=5)
+
+        response = paginator.get_paginated_response([], 20, make_request())
+        self.assertEqual(response.next, "http://testserver/items?page=2")
+
+        response = paginator.get_paginated_response([], 20, make_request("page_size=5"))
+        self.assertEqual(response.next, "http://testserver/items?page_size=5&page=2")
+
+    def test_single_page(self):
+        """Test responses that fit on one page carry no links."""
+        paginator = FastAPIPageNumberPagination(page_size=5)
+
+        response = paginator.get_paginated_response([1, 2, 3], 3, make_request())
+        self.assertEqual((response.next, response.previous), (None, None))
+        self.assertEqual((response.total_pages, response.has_next, response.has_previous), (1, False, False))
+
+        response = paginator.get_paginated_response([], 0, make_request())
+        self.assertEqual(response.total_pages, 0)
+
+        response = paginator.get_paginated_response([], 3, make_request("page=2"))
+        self.assertTrue(response.has_previous)
+        self.assertEqual(response.previous, "http://testserver/items?page=1")
+
+        limit_offset = FastAPILimitOffsetPagination(default_limit=10)
+        response = limit_offset.get_paginated_response([1, 2], 2, make_request())
+        self.assertEqual((response.next, response.previous, response.has_next), (None, None, False))
+
+    def test_limit_offset_links(self):
+        """Test limit/offset links."""
+        paginator = FastAPILimitOffsetPagination(default_limit=10)
+        request = make_request("offset=5&limit=10")
+        response = paginator.get_paginated_response([], 30, request)
+
+        self.assertEqual(response.next, "http://testserver/items?offset=15&limit=10")
+        self.assertEqual(response.previous, "http://testserver/items?offset=0&limit=10")
+
+    def test_generator_queryset(self):
+        """Test generators are consumed only up to the end of the page."""
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        paginator = FastAPILimitOffsetPagination(default_limit=5)
+        page = paginator.paginate_queryset(rows(), make_request("offset=10"))
+        self.assertEqual(page, [10, 11, 12, 13, 14])
+        self.assertEqual(len(consumed), 15)
+
+        page = FastAPIPageNumberPagination(page_size=5).paginate_queryset(rows(), make_request("page=3"))
+        self.assertEqual(page, [10, 11, 12, 13, 14])
+
+    def test_params_cached_per_paginator(self):
+        """Test differently configured paginators on one request keep their own params."""
+        request = make_request()
+        for page_size in (10, 50, 25):
+            paginator = FastAPIPageNumberPagination(page_size=page_size)
+            self.assertEqual(paginator.get_pagination_params(request).page_size, page_size)
+            self.assertEqual(len(paginator.paginate_queryset(list(range(100)), request)), page_size)
+
+    def test_limit_offset_params(self):
+        """Test limit/offset parsing, clamping and fallbacks."""
+        paginator = FastAPILimitOffsetPagination(default_limit=10, max_limit=50)
+        cases = (
+            ("", (10, 0)),
+            ("limit=500&offset=7", (50, 7)),
+            ("limit=abc&offset=7", (10, 7)),
+            ("limit=5&offset=abc", (5, 0)),
+        )
+        for query_string, expected in cases:
+            params = paginator.get_pagination_params(make_request(query_string))
+            self.assertEqual((params.limit, params.offset), expected)
+
+        with self.assertRaises(HTTPException):
+            paginator.get_pagination_params(make_request("limit=0"))
+
+    def test_response_skips_validation(self):
+        """Test the response wraps the page without copying or validating it."""
+        paginator = FastAPIPageNumberPagination(page_size=5)
+        paginator.include_total = False
+        data = [Item(id=1, name="a", score=1)]
+        response = paginator.get_paginated_response(data, 1, make_request())
+
+        self.assertIs(response.results, data)
+        self.assertIsNone(response.count)
+        self.assertIsNone(response.total_pages)
+
+    def test_cached_response(self):
+        """Test responses for the same queryset and URL are reused."""
+        paginator = FastAPIPageNumberPagination(page_size=5, cache_seconds=60)
+        rows = tuple(range(20))
+
+        first = paginator.get_cached_response(rows, make_request("page=2"))
+        self.assertIs(paginator.get_cached_response(rows, make_request("page=2")), first)
+        self.assertIsNot(paginator.get_cached_response(rows, make_request("page=3")), first)
+        self.assertIsNot(paginator.get_cached_response(tuple(range(20)), make_request("page=2")), first)
+        self.assertEqual(first.results, (5, 6, 7, 8, 9))
+
+    def test_cache_headers(self):
+        """Test Cache-Control is emitted only when cache_seconds is set."""
+        from fastapi import FastAPI, Response
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        cached = FastAPIPageNumberPagination(cache_seconds=60)
+        uncached = FastAPIPageNumberPagination()
+
+        @app.get("/cached")
+        def cached_items(request: Request, response: Response):
+            cached.set_cache_headers(response)
+            return cached.get_cached_response(list(range(3)), request)
+
+        @app.get("/uncached")
+        def uncached_items(request: Request, response: Response):
+            uncached.set_cache_headers(response)
+            return uncached.get_cached_response(list(range(3)), request)
+
+        client = TestClient(app)
+        self.assertEqual(client.get("/cached").headers["cache-control"], "public, max-age=60")
+        self.assertNotIn("cache-control", client.get("/uncached").headers)
+
+    def test_cache_headers_with_decorator(self):
+        """Test headers set on the injected response survive the decorators."""
+        from fastapi import FastAPI, Response
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        paginator = FastAPIPageNumberPagination(cache_seconds=60)
+
+        @app.get("/items")
+        @paginate_with_page_number()
+        def items(request: Request, response: Response):
+            paginator.set_cache_headers(response)
+            return paginator.get_cached_response(list(range(3)), request)
+
+        @app.get("/async-items")
+        @paginate_with_page_number()
+        async def async_items(request: Request, response: Response):
+            paginator.set_cache_headers(response)
+            response.status_code = 203
+            return paginator.get_cached_response(list(range(3)), request)
+
+        client = TestClient(app)
+        response = client.get("/items")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], "public, max-age=60")
+        self.assertEqual(response.json()["results"], [0, 1, 2])
+
+        response = client.get("/async-items")
+        self.assertEqual(response.status_code, 203)
+        self.assertEqual(response.headers["cache-control"], "public, max-age=60")
+
+    def test_paginate_decorators(self):
+        """Test decorated routes keep their signature and render the response."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        items = [Item(id=i, name=f"Item {i}", score=i) for i in range(1, 8)]
+
+        @app.get("/pages")
+        @paginate_with_page_number()
+        def pages(request: Request, page_size: int = 3):
+            paginator = FastAPIPageNumberPagination(page_size=page_size)
+            data = paginator.paginate_queryset(items, request)
+            return paginator.get_paginated_response(data, len(items), request)
+
+        @app.get("/cursor")
+        @paginate_with_cursor()
+        async def cursor(request: Request):
+            paginator = FastAPICursorPagination(page_size=2)
+            data = paginator.paginate_queryset(items, request)
+            return paginator.get_paginated_response(data, len(items), request)
+
+        client = TestClient(app)
+        body = client.get("/pages?page=2&page_size=3").json()
+        self.assertEqual([item["id"] for item in body["results"]], [4, 5, 6])
+        self.assertEqual(body["total_pages"], 3)
+
+        body = client.get("/cursor?cursor=5").json()
+        self.assertEqual([item["id"] for item in body["results"]], [4, 3])
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_response(self):
+        """Test responses render dataclass and model results."""
+        import json
+        from pydantic import BaseModel
+
+        class Row(BaseModel):
+            id: int
+
+        paginator = FastAPIPageNumberPagination(page_size=2)
+        request = make_request("page=1")
+        for data, expected in (
+            ([Item(id=1, name="a", score=0)], [{"id": 1, "name": "a", "score": 0}]),
+            ([Row(id=2)], [{"id": 2}]),
+        ):
+            result = paginator.get_paginated_response(data, 1, request)
+            body = json.loads(PaginatedORJSONResponse(result).body)
+            self.assertEqual(body["results"], expected)
+            self.assertEqual(body["count"], 1)
+
+    def test_params_parsed_once_per_request(self):
+        """Test pagination params are cached on the request."""
+        paginator = FastAPIPageNumberPagination(page_size=5)
+        request = make_request("page=2")
+        calls = []
+        parse = paginator._parse_pagination_params
+
+        def counting_parse(req):
+            calls.append(req)
+            return parse(req)
+
+        paginator._parse_pagination_params = counting_parse
+        data = paginator.paginate_queryset(list(range(20)), request)
+        response = paginator.get_paginated_response(data, 20, request)
+
+        self.assertEqual(response.results, [5, 6, 7, 8, 9])
+        self.assertEqual(len(calls), 1)
+        paginator.get_pagination_params(make_request("page=3"))
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
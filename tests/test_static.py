@@ -0,0 +1,436 @@
+#!/usr/bin/env python
+"""
+Tests for FastJango static file helpers.
+"""
+
+import asyncio
+import os
+import sys
+import types
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path if script is run from tests directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from fastapi import FastAPI
+
+try:
+    import fastjango.static  # noqa: F401
+except ImportError:
+    # The package __init__ also imports storage backends that are missing
+    # from this tree; register a bare package so the submodules load alone
+    _package = types.ModuleType("fastjango.static")
+    _package.__path__ = [os.path.join(ROOT, "fastjango", "static")]
+    sys.modules["fastjango.static"] = _package
+
+from fastjango.static import files, utils
+from fastjango.static.files import StaticFilesHandler, collectstatic, find_static_files
+from fastjango.static.middleware import StaticFilesMiddleware
+
+
+def write_files(directory, names, content="x"):
+    """Create each named file, with its parent directories, under directory."""
+    for name in names:
+        path = Path(directory, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+class FindStaticFilesTest(unittest.TestCase):
+    """Test suite for find_static_files."""
+
+    FILES = (
+        "a.css",
+        ".hidden.css",
+        "css/b.css",
+        "css/f.js",
+        "css/x/c.css",
+        "css/x/y/d.css",
+        "css/x/css/g.css",
+        "js/css/e.css",
+        "img/logo.png",
+        "img/x/y/z.png",
+    )
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        write_files(self.directory, self.FILES)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_matches_rglob(self):
+        """Test results match Path.rglob, including ** components."""
+        patterns = (
+            "*", "*.css", "css/*.css", "css/*/*.css", "x/*.css",
+            "**", "**/*.css", "css/**", "css/**/*.css", "css/**/**/*.css",
+            "**/x/**/*.css", "x/**/d.css", "*/**/*.png", "**/css/*.css",
+        )
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                expected = sorted(
+                    str(path.relative_to(self.directory))
+                    for path in Path(self.directory).rglob(pattern)
+                    if path.is_file()
+                )
+                self.assertEqual(sorted(find_static_files(self.directory, pattern)), expected)
+
+    def test_unreadable_directory(self):
+        """Test directories that cannot be listed are skipped."""
+        scandir = os.scandir
+        locked = os.path.join(self.directory, "css", "x")
+
+        def guarded_scandir(path):
+            if os.fspath(path) == locked:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        with patch.object(files.os, "scandir", guarded_scandir):
+            found = sorted(find_static_files(self.directory, "*.css"))
+            handler = StaticFilesHandler([self.directory])
+
+        self.assertIn(os.path.join("css", "b.css"), found)
+        self.assertNotIn(os.path.join("css", "x", "c.css"), found)
+        self.assertIsNotNone(handler.find_file("css/b.css"))
+
+    def test_missing_directory(self):
+        """Test a missing directory yields no files."""
+        self.assertEqual(find_static_files(os.path.join(self.directory, "missing")), [])
+
+
+class ContentTypeTest(unittest.TestCase):
+    """Test suite for the cached content type lookup."""
+
+    def test_guess_content_type(self):
+        """Test types come from the last extension, or the one before an encoding."""
+        cases = (
+            ("css/app.css", "text/css"),
+            ("js/app.3f9a8c.js", "text/javascript"),
+            ("data/archive.tar.gz", "application/x-tar"),
+            ("img/logo.v2.PNG", "image/png"),
+            (".hidden", "application/octet-stream"),
+            ("README", "application/octet-stream"),
+        )
+        for path, content_type in cases:
+            with self.subTest(path=path):
+                self.assertEqual(files._guess_content_type(path), content_type)
+
+    def test_fingerprinted_names_share_an_entry(self):
+        """Test fingerprinted names hit the extension's cache entry."""
+        files._guess_content_type("app.js")
+        size = files._content_type_for.cache_info().currsize
+        for fingerprint in ("3f9a8c", "77aa01", "b0b0b0"):
+            files._guess_content_type(f"app.{fingerprint}.js")
+        self.assertEqual(files._content_type_for.cache_info().currsize, size)
+
+
+class StaticFilesMiddlewareTest(unittest.TestCase):
+    """Test suite for the static files middleware."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.static_dir = os.path.join(self.directory, "static")
+        write_files(self.static_dir, ["css/app.css"], "body {}")
+
+        self.app = FastAPI()
+
+        @self.app.get("/hello")
+        async def hello():
+            return {"message": "Hello World"}
+
+        self.app.add_middleware(StaticFilesMiddleware, static_dirs=[self.static_dir])
+
+        from fastapi.testclient import TestClient
+        self.client = TestClient(self.app)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_serves_file(self):
+        """Test a static file is served with its validators."""
+        response = self.client.get("/static/css/app.css")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "body {}")
+        self.assertTrue(response.headers["content-type"].startswith("text/css"))
+        self.assertTrue(response.headers["etag"].startswith('W/"'))
+        self.assertIn("last-modified", response.headers)
+        self.assertEqual(response.headers["cache-control"], "public, max-age=31536000")
+
+    def test_conditional_get(self):
+        """Test revalidation by ETag, weakly compared, and by date."""
+        response = self.client.get("/static/css/app.css")
+        etag = response.headers["etag"]
+
+        for headers in ({"If-None-Match": etag},
+                        {"If-None-Match": etag[2:]},
+                        {"If-None-Match": f'"other", {etag}'},
+                        {"If-Modified-Since": response.headers["last-modified"]}):
+            revalidated = self.client.get("/static/css/app.css", headers=headers)
+            self.assertEqual(revalidated.status_code, 304)
+            self.assertEqual(revalidated.headers["etag"], etag)
+
+        changed = self.client.get("/static/css/app.css", headers={"If-None-Match": '"other"'})
+        self.assertEqual(changed.status_code, 200)
+
+    def test_missing_file(self):
+        """Test a missing file is a JSON 404, not a server error."""
+        response = self.client.get("/static/css/missing.css")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Static file not found"})
+
+    def test_other_paths_pass_through(self):
+        """Test requests outside the static prefix reach the app."""
+        response = self.client.get("/hello")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"message": "Hello World"})
+
+    def test_lookup(self):
+        """Test lookups refuse traversal and find files added later."""
+        static = StaticFilesMiddleware(self.app, static_dirs=[self.static_dir])
+
+        self.assertIsNone(static._lookup("../static/css/app.css"))
+        self.assertIsNone(static._lookup("css/new.css"))
+        write_files(self.static_dir, ["css/new.css"])
+        self.assertEqual(static._lookup("css/new.css"), os.path.join(self.static_dir, "css/new.css"))
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks are not supported")
+    def test_symlinked_directory(self):
+        """Test files under a symlinked directory are served."""
+        write_files(self.directory, ["real/lib/x.js"], "js")
+        os.symlink(os.path.join(self.directory, "real", "lib"), os.path.join(self.static_dir, "vendor"))
+
+        response = self.client.get("/static/vendor/x.js")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "js")
+
+    def test_immutable(self):
+        """Test immutable mode marks responses and reuses the stat."""
+        static = StaticFilesMiddleware(self.app, static_dirs=[self.static_dir], immutable=True)
+        full_path = static._lookup("css/app.css")
+
+        self.assertIs(static._stat(full_path), static._stat(full_path))
+        self.assertEqual(static._cache_control, "public, max-age=31536000, immutable")
+
+
+class SendfileResponseTest(unittest.TestCase):
+    """Test suite for the zero-copy file response."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "app.js")
+        write_files(self.directory, ["app.js"], "console.log(1);")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def send_response(self, extension):
+        """Send a response to a server offering the given ASGI extension."""
+        messages = []
+        scope = {"type": "http", "method": "GET", "headers": [], "extensions": {extension: {}}}
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            if "file" in message:
+                message = dict(message, data=message["file"].read())
+            messages.append(message)
+
+        response = files.SendfileResponse(self.path, stat_result=os.stat(self.path))
+        asyncio.run(response(scope, receive, send))
+        return messages
+
+    def test_zerocopysend(self):
+        """Test servers offering zerocopysend get an open file."""
+        start, body = self.send_response("http.response.zerocopysend")
+
+        self.assertEqual(start["type"], "http.response.start")
+        self.assertEqual(start["status"], 200)
+        self.assertEqual(body["type"], "http.response.zerocopysend")
+        self.assertEqual(body["data"], b"console.log(1);")
+        self.assertEqual(body["count"], len(b"console.log(1);"))
+        self.assertTrue(body["file"].closed)
+
+    def test_pathsend(self):
+        """Test servers offering pathsend get the absolute path."""
+        start, body = self.send_response("http.response.pathsend")
+
+        self.assertEqual(start["type"], "http.response.start")
+        self.assertEqual(body, {"type": "http.response.pathsend", "path": self.path})
+
+
+class StaticFilesHandlerTest(unittest.TestCase):
+    """Test suite for the static files handler."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.first = os.path.join(self.directory, "first")
+        self.second = os.path.join(self.directory, "second")
+        write_files(self.first, ["app.css"], "first")
+        write_files(self.second, ["app.css", "js/app.js"], "second")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_find_file(self):
+        """Test the first directory wins and unsafe names are refused."""
+        handler = StaticFilesHandler([self.first, self.second])
+
+        info = handler.find_file("app.css")
+        self.assertEqual(info["path"], os.path.join(self.first, "app.css"))
+        self.assertEqual(info["size"], len("first"))
+        self.assertEqual(handler.find_file("js/app.js")["path"], os.path.join(self.second, "js/app.js"))
+        self.assertIsNone(handler.find_file("../first/app.css"))
+        self.assertIsNone(handler.find_file("missing.css"))
+
+
+class CollectStaticTest(unittest.TestCase):
+    """Test suite for collectstatic."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.first = os.path.join(self.directory, "first")
+        self.second = os.path.join(self.directory, "second")
+        self.destination = os.path.join(self.directory, "collected")
+        write_files(self.first, ["app.css", "js/app.js", "notes.tmp", "node_modules/lib/index.js"], "first")
+        write_files(self.second, ["app.css"], "second")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_copies_and_ignores(self):
+        """Test files are copied, ignored files and directories skipped."""
+        result = collectstatic([self.first, self.second], self.destination,
+                               ignore_patterns=["*.tmp", "node_modules"])
+
+        self.assertEqual(sorted(result["skipped_files"]), ["node_modules", "notes.tmp"])
+        self.assertEqual(sorted(find_static_files(self.destination)), ["app.css", os.path.join("js", "app.js")])
+        # A later source directory overrides an earlier one
+        self.assertEqual(Path(self.destination, "app.css").read_text(), "second")
+        self.assertEqual(Path(self.destination, "js", "app.js").read_text(), "first")
+        self.assertEqual(os.stat(os.path.join(self.first, "js", "app.js")).st_mtime,
+                         os.stat(os.path.join(self.destination, "js", "app.js")).st_mtime)
+
+    def test_dry_run(self):
+        """Test a dry run reports files without copying them."""
+        result = collectstatic([self.first], self.destination, dry_run=True)
+
+        self.assertEqual(result["total_collected"], 4)
+        self.assertFalse(os.path.exists(self.destination))
+
+
+class StaticTemplateGlobalsTest(unittest.TestCase):
+    """Test suite for the static template helpers."""
+
+    def test_static_url_global(self):
+        """Test the static_url global uses the configured prefix unless given one."""
+        app = FastAPI()
+        app.state.template_globals = {}
+        utils.setup_static_utils(app, {"STATIC_URL": "/assets/"})
+        static_url = app.state.template_globals["static_url"]
+
+        self.assertEqual(static_url("css/app.css"), "/assets/css/app.css")
+        self.assertEqual(static_url("/css/app.css"), "/assets/css/app.css")
+        self.assertEqual(static_url("css/app.css", "/cdn/"), "/cdn/css/app.css")
+        self.assertEqual(static_url("css/app.css", static_url="/cdn"), "/cdn/css/app.css")
+
+
+class StaticPathCacheTest(unittest.TestCase):
+    """Test suite for the cached static path lookups."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        write_files(self.directory, ["app.css"])
+        utils.clear_static_cache()
+
+    def tearDown(self):
+        utils.clear_static_cache()
+        shutil.rmtree(self.directory)
+
+    def test_lookups_are_cached(self):
+        """Test lookups, misses included, are cached until cleared."""
+        self.assertEqual(utils.get_static_path("app.css", [self.directory]),
+                         Path(self.directory, "app.css"))
+        self.assertIsNone(utils.get_static_path("new.css", [self.directory]))
+        self.assertIsNone(utils.get_static_path("../app.css", [self.directory]))
+
+        write_files(self.directory, ["new.css"])
+        self.assertIsNone(utils.get_static_path("new.css", [self.directory]))
+
+        utils.clear_static_cache()
+        self.assertEqual(utils.get_static_path("new.css", [self.directory]),
+                         Path(self.directory, "new.css"))
+
+    def test_deleted_file(self):
+        """Test a cached path whose file was deleted counts as a miss."""
+        self.assertIsNotNone(utils.get_static_hash("app.css", [self.directory]))
+        self.assertEqual(utils.get_static_file_info("app.css", [self.directory])["size"], 1)
+
+        os.remove(os.path.join(self.directory, "app.css"))
+
+        self.assertIsNone(utils.get_static_hash("app.css", [self.directory]))
+        self.assertEqual(utils.get_static_file_info("app.css", [self.directory]), {})
+        self.assertIsNone(utils.get_static_path("app.css", [self.directory]))
+
+    def test_watched_lookup_racing_a_clear(self):
+        """Test a lookup that raced a cache clear is not cached forever."""
+        resolve = utils._resolve_static_path
+
+        def resolve_then_clear(filename, static_dirs):
+            result = resolve(filename, static_dirs)
+            # A watch event arrives between the lookup and the insert
+            utils.clear_static_cache()
+            return result
+
+        utils._watched_dirs.add(os.path.abspath(self.directory))
+        utils._resolve_static_path = resolve_then_clear
+        try:
+            self.assertIsNone(utils.get_static_path("new.css", [self.directory]))
+        finally:
+            utils._resolve_static_path = resolve
+            utils._watched_dirs.discard(os.path.abspath(self.directory))
+
+        cached = utils._static_path_cache[("new.css", (self.directory,))]
+        self.assertNotEqual(cached[1], float("inf"))
+
+        utils._watched_dirs.add(os.path.abspath(self.directory))
+        try:
+            utils.get_static_path("app.css", [self.directory])
+        finally:
+            utils._watched_dirs.discard(os.path.abspath(self.directory))
+        self.assertEqual(utils._static_path_cache[("app.css", (self.directory,))][1], float("inf"))
+
+    def test_entries_expire(self):
+        """Test cached lookups expire after the TTL."""
+        self.assertIsNone(utils.get_static_path("new.css", [self.directory]))
+        write_files(self.directory, ["new.css"])
+
+        ttl = utils._STATIC_PATH_TTL
+        utils._STATIC_PATH_TTL = 0
+        try:
+            utils.clear_static_cache()
+            self.assertIsNone(utils.get_static_path("missing.css", [self.directory]))
+            self.assertEqual(utils.get_static_path("new.css", [self.directory]),
+                             Path(self.directory, "new.css"))
+            write_files(self.directory, ["missing.css"])
+            self.assertIsNotNone(utils.get_static_path("missing.css", [self.directory]))
+        finally:
+            utils._STATIC_PATH_TTL = ttl
+
+
+def run_tests():
+    """Run the static file tests."""
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()